@@ -1,44 +1,72 @@
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                               QHBoxLayout, QLineEdit, QPushButton, QLabel,
-                              QScrollArea, QStackedWidget, QTableWidget,
-                              QTableWidgetItem, QHeaderView, QComboBox,
-                              QAbstractItemView, QMessageBox)
-from PySide6.QtCore import (Qt, QTimer, QThread, Signal, QUrl, QByteArray, 
-                              QBuffer, QLoggingCategory)
+                              QListView, QStackedWidget, QTableView,
+                              QHeaderView, QComboBox, QStyle,
+                              QStyledItemDelegate, QAbstractItemView, QMessageBox)
+from PySide6.QtCore import (Qt, QTimer, QThread, Signal, QUrl, QRect, QRectF,
+                              QSize, QLoggingCategory, QAbstractListModel,
+                              QAbstractTableModel, QModelIndex, QRunnable,
+                              QThreadPool, QStringListModel, QEvent,
+                              QDeadlineTimer)
 from urllib3.exceptions import InsecureRequestWarning
 from urllib.parse import quote_plus
-from PySide6.QtGui import QFont, QDesktopServices, QIcon, QPixmap
+from PySide6.QtGui import (QFont, QFontMetrics, QDesktopServices, QIcon, QImage,
+                           QColor, QPainter, QPen, QBrush, QPalette, QTextLayout)
 from urllib.parse import urlparse
 from urllib.parse import urlunparse, parse_qsl, urlencode, unquote
 import sys
 import os
 import json
+import re
+import html
 import requests
+from requests.adapters import HTTPAdapter
 import time
 from datetime import datetime
-from typing import Any, Optional
-import base64
+from typing import Any, Callable, Optional
+from dataclasses import dataclass
 import pathlib
+import functools
+import heapq
+import operator
+import threading
+import queue
+from collections import OrderedDict
+from concurrent.futures import Future, wait, FIRST_COMPLETED
 from favicon import get
+try:
+    import orjson
+except ImportError:
+    # orjson 是可选依赖，缺失时回退到标准库 json
+    orjson = None
+
+def json_loads(data: bytes) -> Any:
+    """解析 JSON 字节串，优先使用 orjson。"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_pretty(obj: Any) -> bytes:
+    """把对象序列化为缩进 2 格的 UTF-8 JSON 字节串，优先使用 orjson。"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
 
 def get_source_path(relative_path: str) -> str:
     return os.path.join(pathlib.Path(__file__).parent.resolve(), relative_path)
 
 
-def icon_to_base64(icon: QIcon, size: tuple[int, int] = (32, 32)) -> str:
-    """将QIcon转换为Base64字符串"""
-    pixmap = icon.pixmap(*size)
-    
-    # 将QPixmap转换为Base64
-    byte_array = QByteArray()
-    buffer = QBuffer(byte_array)
-    buffer.open(QBuffer.WriteOnly)
-    pixmap.save(buffer, "PNG")  # 保存为PNG格式
-    buffer.close()
-    
-    # 编码为Base64
-    base64_data = base64.b64encode(byte_array.data()).decode('utf-8')
-    return f"data:image/png;base64,{base64_data}"
+# 程序图标路径和顶部 Logo 的 HTML 只在导入时计算一次
+ICON_PATH = get_source_path("icon.ico")
+LOGO_HTML = f"<img src='{ICON_PATH}' width='24' height='24'> EasySearch"
+
+
+@functools.lru_cache(maxsize=1)
+def default_icon() -> QIcon:
+    """站点没有图标时使用的默认图标，首次使用时加载一次"""
+    return QIcon(get_source_path('defaulticon.png'))
 
 
 def normalize_publish_date(value: Any) -> Optional[datetime]:
@@ -48,14 +76,21 @@ def normalize_publish_date(value: Any) -> Optional[datetime]:
     - datetime -> 直接返回
     - int/float -> 当作时间戳（秒或毫秒）解析
     - str -> 支持 ISO 格式、"YYYY-MM-DD" 等，或数字字符串（秒/毫秒）
-    解析失败则返回 None。
+    解析失败则返回 None。数字和字符串的解析结果会被缓存。
     """
     if value is None:
         return None
     # 已经是 datetime
     if isinstance(value, datetime):
         return value
+    if isinstance(value, (int, float, str)):
+        return _parse_publish_date(value)
+    return None
 
+
+@functools.lru_cache(maxsize=2048)
+def _parse_publish_date(value) -> Optional[datetime]:
+    """normalize_publish_date 的可缓存部分，只接收数字或字符串。"""
     # 数字类型：秒或毫秒时间戳
     try:
         if isinstance(value, (int, float)):
@@ -65,35 +100,43 @@ def normalize_publish_date(value: Any) -> Optional[datetime]:
                 ts = ts / 1000.0
             return datetime.fromtimestamp(ts)
         # 字符串形式的数字时间戳
-        if isinstance(value, str):
-            s = value.strip()
-            if not s:
-                return None
-            # 纯数字的字符串 -> 当作时间戳
-            if s.isdigit():
-                iv = int(s)
-                ts = float(iv)
-                if iv > 1e12:
-                    ts = ts / 1000.0
-                return datetime.fromtimestamp(ts)
-            # 尝试 ISO 格式解析
+        s = value.strip()
+        if not s:
+            return None
+        # 纯数字的字符串 -> 当作时间戳
+        if s.isdigit():
+            iv = int(s)
+            ts = float(iv)
+            if iv > 1e12:
+                ts = ts / 1000.0
+            return datetime.fromtimestamp(ts)
+        # 尝试 ISO 格式解析（斜杠分隔的日期一定不是 ISO，直接跳过）
+        if '/' not in s:
             try:
                 return datetime.fromisoformat(s)
-            except Exception:
+            except ValueError:
                 pass
-            # 常见日期格式 YYYY-MM-DD 或 YYYY/MM/DD
-            for fmt in ("%Y-%m-%d", "%Y/%m/%d", "%Y-%m-%d %H:%M:%S", "%Y/%m/%d %H:%M:%S"):
-                try:
-                    return datetime.strptime(s, fmt)
-                except Exception:
-                    pass
+        # 常见日期格式 YYYY-MM-DD 或 YYYY/MM/DD：按分隔符和是否带时间直接选定格式，只尝试一次
+        sep = '/' if '/' in s else '-'
+        fmt = f"%Y{sep}%m{sep}%d %H:%M:%S" if ':' in s else f"%Y{sep}%m{sep}%d"
+        return datetime.strptime(s, fmt)
     except Exception:
         return None
-    return None
 
 
+# canonicalize_url 需要去掉的跟踪参数：utm_*、fbclid、gclid
+_TRACKING_PARAM_RE = re.compile(r'^(?:utm_|fbclid$|gclid$)')
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_urlparse(url: str):
+    """带缓存的 urlparse，ParseResult 是不可变的 namedtuple，可安全复用。"""
+    return urlparse(url)
+
+
+@functools.lru_cache(maxsize=4096)
 def canonicalize_url(url: Optional[str]) -> str:
-    """规范化 URL，用于去重比较。
+    """规范化 URL，用于去重比较（按 URL 缓存结果，重复出现的 URL 不再重新解析）。
 
     - scheme 和 netloc 小写
     - 移除 fragment
@@ -105,10 +148,14 @@ def canonicalize_url(url: Optional[str]) -> str:
     if not url:
         return ''
     try:
-        up = urlparse(url)
+        up = _cached_urlparse(url)
     except Exception:
         return url or ''
+    return _canonicalize_parsed(up, url)
+
 
+def _canonicalize_parsed(up, url: str = '') -> str:
+    """对已解析的 ParseResult 做规范化。"""
     scheme = (up.scheme or 'http').lower()
     netloc = (up.netloc or '').lower()
     # 移除默认端口
@@ -122,15 +169,18 @@ def canonicalize_url(url: Optional[str]) -> str:
     if path != '/' and path.endswith('/'):
         path = path.rstrip('/')
 
-    # 过滤 query 中的跟踪参数
-    try:
-        qsl = parse_qsl(up.query, keep_blank_values=True)
-        filtered = [(k, v) for (k, v) in qsl if not (k.startswith('utm_') or k in ('fbclid', 'gclid'))]
-        # 排序以便可比
-        filtered.sort()
-        query = urlencode(filtered, doseq=True)
-    except Exception:
-        query = ''
+    # 过滤 query 中的跟踪参数（没有 query 时直接跳过）
+    query = ''
+    if up.query:
+        try:
+            qsl = parse_qsl(up.query, keep_blank_values=True)
+            filtered = [(k, v) for (k, v) in qsl if not _TRACKING_PARAM_RE.match(k)]
+            # 排序以便可比
+            if len(filtered) > 1:
+                filtered.sort()
+            query = urlencode(filtered, doseq=True)
+        except Exception:
+            query = ''
 
     # 不保留 fragment
     frag = ''
@@ -142,23 +192,98 @@ def canonicalize_url(url: Optional[str]) -> str:
         return (up.geturl() if hasattr(up, 'geturl') else url) or ''
 
 
+# HTML 标签（含自闭合和结束标签），不会误伤 "a < b" 这类普通文本
+_HTML_TAG_RE = re.compile(r'</?[a-zA-Z][^<>]*>')
+
+
+def html_to_text(text: str) -> str:
+    """去掉搜索接口返回的标题/简介中的 HTML 标签并还原实体（&amp; 等），得到纯文本。"""
+    if '<' not in text and '&' not in text:
+        return text
+    return html.unescape(_HTML_TAG_RE.sub('', text))
+
+
+def _compile_domain_pattern(domains) -> Optional[re.Pattern]:
+    """把域名列表编译成一个正则，search() 的结果与逐个做子串判断相同；列表为空返回 None。"""
+    parts = [re.escape(d) for d in domains if isinstance(d, str)]
+    if not parts:
+        return None
+    return re.compile('|'.join(parts))
+
+
+# 命中黑名单的结果权重，这类结果不会展示
+BLACKLIST_WEIGHT = -999
+
+# 发布 0~4 天内的时间加权，下标为距今天数
+_DATE_BONUS = (0.5, 0.4, 0.3, 0.2, 0.1)
+
+# 搜索引擎配置中的文本字段，顺序与设置页 API 表格第 1 列起的顺序一致（第 0 列是引擎名称）
+ENGINE_FIELDS = ("api_url", "api_key", "results_path", "json_title", "json_url",
+                 "json_snippet", "json_publish_date", "json_keyheader")
+
+# 新建引擎或配置损坏时使用的默认配置
+ENGINE_DEFAULTS = {
+    'enabled': True,
+    'api_url': '',
+    'api_key': '',
+    'results_path': '',
+    'json_title': 'title',
+    'json_url': 'url',
+    'json_snippet': 'snippet',
+    'json_publish_date': 'publish_date',
+    'json_keyheader': ''
+}
+
+
+@dataclass(slots=True)
+class SearchResult:
+    """一条搜索结果。结果数量可能上千条，用 slots 省内存，属性访问也比 dict 取键快"""
+    title: str
+    url: str
+    snippet: str = ''
+    source: str = ''
+    publish_date: Optional[datetime] = None
+    norm_url: str = ''
+    # 站点图标在 worker 线程解码并缩放好；QImage 可以跨线程使用，QPixmap 不行
+    icon: Optional[QImage] = None
+    is_whitelist: bool = False
+    weight: float = 0.0
+    # 发布时间的时间戳，排序用；没有发布时间为 0
+    sort_ts: float = 0.0
+    # 显示用的更新时间文字，由 worker 预先算好，绘制时直接使用
+    time_text: str = '未知'
+
+
 class ICONCacheManager:
+    """基于 OrderedDict 的 LRU 图标缓存，插入和查找都是 O(1)。
+
+    以站点 origin（scheme://netloc）为键；值为 None 表示该站点没有可用图标，
+    用于避免在同一会话内重复请求。
+    """
     def __init__(self, max_size=500):
-        self.cache = {}
+        self.cache = OrderedDict()
         self.max_size = max_size
+        # 搜索线程池会并发读写缓存
+        self._lock = threading.Lock()
 
-    def add_icon(self, url: str, icon_data: QIcon):
-        self.cache[url] = {"icon":icon_data, "timestamp": time.time()}
-        if len(self.cache) > self.max_size:
-            # 删除最旧的图标
-            oldest_url = min(self.cache.items(), key=lambda item: item[1]["timestamp"])[0]
-            del self.cache[oldest_url]
-
-    def get_icon(self, url: str) -> Optional[QIcon]:
-        entry = self.cache.get(url)
-        if entry:
-            return entry["icon"]
-        return None
+    def add_icon(self, url: str, icon_data: Optional[QImage]):
+        with self._lock:
+            self.cache[url] = icon_data
+            self.cache.move_to_end(url)
+            if len(self.cache) > self.max_size:
+                # 删除最久未使用的图标
+                self.cache.popitem(last=False)
+
+    def get_icon(self, url: str) -> Optional[QImage]:
+        return self.lookup(url)[1]
+
+    def lookup(self, url: str) -> tuple[bool, Optional[QImage]]:
+        """返回 (是否命中, 图标)，命中但图标为 None 表示之前获取失败。"""
+        with self._lock:
+            if url not in self.cache:
+                return (False, None)
+            self.cache.move_to_end(url)
+            return (True, self.cache[url])
 
 
 class SearchAPIManager:
@@ -169,38 +294,88 @@ class SearchAPIManager:
         self.authoritative_sites = ["github.com", "stackoverflow.com"]
         self.search_engines = {}
         self.theme_mode = "light"
+        # 设置文件和日志目录只在第一次用到时计算并创建
+        self._settings_path = None
+        self._log_folder = None
+        # 后台保存：_save_lock 保护排队状态，_write_lock 保证同一时间只有一个线程写文件
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._save_pending = False
+        self._pending_snapshot = None
+        self._snapshot_version = 0
+        self._written_version = 0
         # 尝试从磁盘加载已保存设置
         try:
             self.load_settings()
         except Exception:
             pass
-    
-    def calculate_weight(self, result):
-        """计算搜索结果权重"""
+
+    # 黑白名单和权威网站列表通过赋值更新，赋值时重新编译对应的匹配正则
+    @property
+    def blacklist(self):
+        return self._blacklist
+
+    @blacklist.setter
+    def blacklist(self, value):
+        self._blacklist = value
+        self._blacklist_re = _compile_domain_pattern(value)
+
+    @property
+    def whitelist(self):
+        return self._whitelist
+
+    @whitelist.setter
+    def whitelist(self, value):
+        self._whitelist = value
+        self._whitelist_re = _compile_domain_pattern(value)
+
+    @property
+    def authoritative_sites(self):
+        return self._authoritative_sites
+
+    @authoritative_sites.setter
+    def authoritative_sites(self, value):
+        self._authoritative_sites = value
+        self._authoritative_re = _compile_domain_pattern(value)
+
+    def is_blacklisted(self, domain: str) -> bool:
+        return self._blacklist_re is not None and self._blacklist_re.search(domain) is not None
+
+    def is_whitelisted(self, domain: str) -> bool:
+        return self._whitelist_re is not None and self._whitelist_re.search(domain) is not None
+
+    def calculate_weights(self, results, now: Optional[datetime] = None):
+        """批量计算一组结果的权重，当前时间只取一次。"""
+        if now is None:
+            now = datetime.now()
+        return [self.calculate_weight(result, now) for result in results]
+
+    def calculate_weight(self, result, now: Optional[datetime] = None):
+        """计算搜索结果权重，now 为本地时间（naive），不传则取当前时间"""
         weight = 0.0
         
         # 获取域名
         domain = ""
         try:
-            parsed_url = urlparse(result["url"])
+            parsed_url = _cached_urlparse(result.url)
             domain = parsed_url.netloc.lower()
         except:
             pass
         
         # 黑名单检查
-        if any(blocked in domain for blocked in self.blacklist):
-            return -999  # 直接删除
+        if self.is_blacklisted(domain):
+            return BLACKLIST_WEIGHT  # 直接删除
         
         # 白名单权重
-        if any(allowed in domain for allowed in self.whitelist):
+        if self.is_whitelisted(domain):
             weight += 1.5
         
         # 权威网站权重
-        if any(auth in domain for auth in self.authoritative_sites):
+        if self._authoritative_re is not None and self._authoritative_re.search(domain):
             weight += 1.0
         
         # 时间权重：支持 publish_date 为 datetime、数字（秒/毫秒）或字符串
-        publish_date = result.get("publish_date")
+        publish_date = result.publish_date
         try:
             # 尝试归一化为 datetime 对象（如果可能）
             pub_dt = normalize_publish_date(publish_date)
@@ -209,26 +384,19 @@ class SearchAPIManager:
 
         if pub_dt:
             try:
-                # 如果 publish_date 是时区感知的（aware），则让当前时间也为相同的 tz
+                if now is None:
+                    now = datetime.now()
+                # 如果 publish_date 是时区感知的（aware），则把当前时间换算到相同的 tz
                 if getattr(pub_dt, 'tzinfo', None) is not None and pub_dt.tzinfo.utcoffset(pub_dt) is not None:
-                    now = datetime.now(tz=pub_dt.tzinfo)
+                    days_ago = (now.astimezone(pub_dt.tzinfo) - pub_dt).days
                 else:
-                    now = datetime.now()
-                days_ago = (now - pub_dt).days
+                    days_ago = (now - pub_dt).days
             except Exception:
                 days_ago = None
 
             if days_ago is not None:
-                if days_ago == 0:
-                    weight += 0.5
-                elif days_ago == 1:
-                    weight += 0.4
-                elif days_ago == 2:
-                    weight += 0.3
-                elif days_ago == 3:
-                    weight += 0.2
-                elif days_ago == 4:
-                    weight += 0.1
+                if 0 <= days_ago < len(_DATE_BONUS):
+                    weight += _DATE_BONUS[days_ago]
                 elif days_ago >= 30:
                     weight -= 0.5
         
@@ -240,18 +408,20 @@ class SearchAPIManager:
         return []
 
     def get_settings_path(self):
-        appdata = os.getenv('APPDATA') or os.path.expanduser('~')
-        folder = os.path.join(appdata, 'EasySearch')
-        os.makedirs(folder, exist_ok=True)
-        return os.path.join(folder, 'settings.json')
+        if self._settings_path is None:
+            appdata = os.getenv('APPDATA') or os.path.expanduser('~')
+            folder = os.path.join(appdata, 'EasySearch')
+            os.makedirs(folder, exist_ok=True)
+            self._settings_path = os.path.join(folder, 'settings.json')
+        return self._settings_path
 
     def load_settings(self):
         path = self.get_settings_path()
         if not os.path.exists(path):
             return
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(path, 'rb') as f:
+                data = json_loads(f.read())
         except Exception:
             return
 
@@ -273,77 +443,97 @@ class SearchAPIManager:
         if isinstance(se, dict):
             for k, v in se.items():
                 try:
-                    if k in self.search_engines and isinstance(v, dict):
-                        # 更新已有的配置
-                        self.search_engines[k].update({
-                            'enabled': bool(v.get('enabled', self.search_engines[k].get('enabled', True))),
-                            'api_url': v.get('api_url', self.search_engines[k].get('api_url', '')) or '',
-                            'api_key': v.get('api_key', self.search_engines[k].get('api_key', '')) or '',
-                            'results_path': v.get('results_path', self.search_engines[k].get('results_path', '')) or '',
-                            'json_title': v.get('json_title', self.search_engines[k].get('json_title', 'title')),
-                            'json_url': v.get('json_url', self.search_engines[k].get('json_url', '')),
-                            'json_snippet': v.get('json_snippet', self.search_engines[k].get('json_snippet', '')),
-                            'json_publish_date': v.get('json_publish_date', self.search_engines[k].get('json_publish_date', '')),
-                            'json_keyheader': v.get('json_keyheader', self.search_engines[k].get('json_keyheader', ''))
-                        })
+                    if not isinstance(v, dict):
+                        continue
+                    # 已有的配置在原值基础上更新，新的引擎从空配置开始
+                    base = self.search_engines.get(k, {})
+                    cfg = {'enabled': bool(v.get('enabled', base.get('enabled', True)))}
+                    for field in ENGINE_FIELDS:
+                        cfg[field] = v.get(field, base.get(field, '')) or ''
+                    if k in self.search_engines:
+                        self.search_engines[k].update(cfg)
                     else:
-                        # 新的引擎配置
-                        if isinstance(v, dict):
-                            self.search_engines[k] = {
-                                'enabled': bool(v.get('enabled', True)),
-                                'api_url': v.get('api_url', '') or '',
-                                'api_key': v.get('api_key', '') or '',
-                                'results_path': v.get('results_path', '') or '',
-                                'json_title': v.get('json_title', ''),
-                                'json_url': v.get('json_url', ''),
-                                'json_snippet': v.get('json_snippet', ''),
-                                'json_publish_date': v.get('json_publish_date', ''),
-                                'json_keyheader': v.get('json_keyheader', '')
-                            }
+                        self.search_engines[k] = cfg
                 except Exception:
                     # 某项有错，跳过用默认
-                    self.search_engines[k] = {
-                        'enabled': True,
-                        'api_url': '',
-                        'api_key': '',
-                        'results_path': '',
-                        'json_title': 'title',
-                        'json_url': 'url',
-                        'json_snippet': 'snippet',
-                        'json_publish_date': 'publish_date',
-                        'json_keyheader': ''
-                    }
+                    self.search_engines[k] = dict(ENGINE_DEFAULTS)
 
         # 主题
         tm = data.get('theme_mode')
         if tm in ('light', 'dark', 'system'):
             self.theme_mode = tm
 
-    def save_settings(self):
-        path = self.get_settings_path()
-        data = {
+    def settings_snapshot(self) -> dict:
+        """复制一份当前设置，之后在其他线程序列化也不受界面修改影响。"""
+        return {
             'blacklist': list(self.blacklist),
             'whitelist': list(self.whitelist),
-            'search_engines': self.search_engines,
+            'search_engines': {name: dict(cfg) for name, cfg in self.search_engines.items()},
             'theme_mode': self.theme_mode
         }
-        try:
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except Exception:
-            # 保存失败时忽略（不影响主流程）
-            pass
+
+    def save_settings(self):
+        """在当前线程立即保存设置。"""
+        self._write_settings(*self._take_snapshot())
+
+    def save_settings_async(self):
+        """在当前（GUI）线程取快照，交给线程池写盘。
+
+        已有写盘任务在排队时只替换它要写的快照，不重复提交任务。
+        """
+        snapshot = self._take_snapshot()
+        with self._save_lock:
+            self._pending_snapshot = snapshot
+            if self._save_pending:
+                return
+            self._save_pending = True
+        QThreadPool.globalInstance().start(SettingsPersistenceWorker(self))
+
+    def write_pending_settings(self):
+        """由线程池任务调用：取出排队的快照并写盘。"""
+        with self._save_lock:
+            snapshot = self._pending_snapshot
+            self._pending_snapshot = None
+            self._save_pending = False
+        if snapshot is not None:
+            self._write_settings(*snapshot)
+
+    def _take_snapshot(self):
+        # 快照带递增版本号，只在 GUI 线程调用
+        self._snapshot_version += 1
+        return self._snapshot_version, self.settings_snapshot()
+
+    def _write_settings(self, version, data):
+        path = self.get_settings_path()
+        with self._write_lock:
+            # 后台和同步保存可能交错，旧快照不能覆盖已写入的新快照
+            if version <= self._written_version:
+                return
+            # 先写临时文件再原子替换，避免写到一半崩溃导致设置文件损坏
+            tmp_path = path + '.tmp'
+            try:
+                buf = json_dumps_pretty(data)
+                with open(tmp_path, 'wb') as f:
+                    f.write(buf)
+                os.replace(tmp_path, path)
+                self._written_version = version
+            except Exception:
+                # 保存失败时忽略（不影响主流程）
+                pass
 
     def log_error(self, message: str) -> str:
         """把错误信息写入到 %APPDATA%/EasySearch/Logs 下，返回日志文件路径。"""
         try:
-            appdata = os.getenv('APPDATA') or os.path.expanduser('~')
-            folder = os.path.join(appdata, 'EasySearch', 'Logs')
-            os.makedirs(folder, exist_ok=True)
-            fname = datetime.now().strftime("%Y_%m_%d_%H_%M_%S_EasySearch_ErrorLog.log")
-            path = os.path.join(folder, fname)
+            if self._log_folder is None:
+                appdata = os.getenv('APPDATA') or os.path.expanduser('~')
+                folder = os.path.join(appdata, 'EasySearch', 'Logs')
+                os.makedirs(folder, exist_ok=True)
+                self._log_folder = folder
+            now = datetime.now()
+            fname = now.strftime("%Y_%m_%d_%H_%M_%S_EasySearch_ErrorLog.log")
+            path = os.path.join(self._log_folder, fname)
             with open(path, 'w', encoding='utf-8') as f:
-                f.write(f"[{datetime.now().isoformat()}]\n")
+                f.write(f"[{now.isoformat()}]\n")
                 f.write(message)
                 f.write('\n')
             return path
@@ -351,241 +541,476 @@ class SearchAPIManager:
             return ''
 
 
+class SettingsPersistenceWorker(QRunnable):
+    """在线程池中把排队的设置快照写入磁盘。"""
+
+    def __init__(self, api_manager):
+        super().__init__()
+        self.api_manager = api_manager
+
+    def run(self):
+        self.api_manager.write_pending_settings()
+
+
+# 这些域名的证书链经常被本地代理/加速器替换，请求时跳过 SSL 校验
+NO_SSL_VERIFY_DOMAINS = (
+    'github.com',
+    'steamcommunity.com',
+    'store.steampowered.com'
+)
+
+ICON_HEADERS = {'User-Agent':'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'}
+
+IMAGE_MIME_TYPES = (
+    'image/x-icon',
+    'image/vnd.microsoft.icon',
+    'image/png',
+    'image/jpeg',
+    'image/jpg',
+    'image/gif',
+    'image/bmp',
+    'image/svg+xml',
+    'image/webp'
+)
+
+
+def _get_base_url(url, edit_sw=False):
+    """返回 (站点根地址, 是否校验 SSL)。"""
+    return _site_origin(_cached_urlparse(url), edit_sw)
+
+
+def _site_origin(parsed, edit_sw=False):
+    """由已解析的 URL 得到 (站点 origin, 是否校验 SSL)，用作图标缓存的键。"""
+    origin = f"{parsed.scheme}://{parsed.netloc.lower()}"
+    if edit_sw and origin.endswith('stackoverflow.com'):
+        origin = 'https://stackoverflow.co'
+    ssl_verify = not any(origin.endswith(d) for d in NO_SSL_VERIFY_DOMAINS)
+    return (origin, ssl_verify)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_json_path(path: str) -> Callable[[Any], Any]:
+    """把 .a.b 形式的路径编译成取值函数，同一路径只解析一次。
+
+    返回的函数逐级按 dict 取值，遇到非 dict（包括列表）时返回 None；
+    空路径或 "." 表示取对象本身。
+    """
+    # 去掉开头的点
+    if path.startswith('.'):
+        path = path[1:]
+    parts = tuple(p for p in path.split('.') if p)
+    if not parts:
+        return lambda obj: obj
+
+    def accessor(obj):
+        for p in parts:
+            if not isinstance(obj, dict):
+                # 不支持数字索引的复杂情况，返回空
+                return None
+            obj = obj.get(p)
+        return obj
+
+    return accessor
+
+
+class _DaemonPool:
+    """固定数量的守护线程从同一个队列取任务执行，submit() 返回 Future。
+
+    守护线程不会拖住程序退出；线程按需启动，最多 size 个。
+    排队期间调用 future.cancel() 可以直接取消，shutdown() 后线程做完手头的任务就退出。
+    """
+    _STOP = object()
+
+    def __init__(self, size):
+        self._size = max(1, size)
+        self._queue = queue.SimpleQueue()
+        self._threads = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args) -> Future:
+        future = Future()
+        with self._lock:
+            if self._closed:
+                future.cancel()
+                return future
+            self._queue.put((future, fn, args))
+            if self._threads < self._size:
+                self._threads += 1
+                threading.Thread(target=self._run, daemon=True).start()
+        return future
+
+    def shutdown(self):
+        """不再接受新任务，并让所有线程在队列取空后退出（不等待）。"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for _ in range(self._threads):
+                self._queue.put(self._STOP)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            future, fn, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+
 class SearchWorker(QThread):
-    """在后台线程中运行搜索并通过信号返回结果"""
+    """在后台线程中运行搜索并通过信号返回结果
+
+    各搜索引擎的请求在守护线程中并发执行，哪个引擎先返回就先发出哪个的结果；
+    同一次搜索内的图标请求也并发获取，并复用同一个 Session。
+    stop() 为协作式取消：取消排队中的请求，不再发出任何信号，run() 随即返回；
+    已经发出的请求仍会等到完成或超时，其结果直接丢弃。线程池中的线程可能比 run() 晚结束，
+    用 is_idle() 判断它们是否都已退出，之后才能销毁 worker。
+    """
     results_ready = Signal(list)
     # 当后台搜索出现错误时发出，参数为错误描述字符串
     error_occurred = Signal(str)
 
+    # 同时获取图标的最大线程数
+    ICON_WORKERS = 8
+    # run() 检查取消请求的间隔（秒）
+    POLL_INTERVAL = 0.1
+    # 每个引擎每批发回的结果条数
+    BATCH_SIZE = 8
+
     def __init__(self, api_manager, query, parent=None):
         super().__init__(parent)
         self.api_manager = api_manager
         self.query = query
+        self._session = None
+        # 图标请求由固定数量的线程排队获取，不为每个站点单独开线程
+        self._icon_pool = _DaemonPool(self.ICON_WORKERS)
+        self._engine_pool = None
+        # 同一站点的图标只请求一次：origin -> Future
+        self._icon_futures = {}
+        self._icon_lock = threading.Lock()
+        self._engine_futures = {}
+        # 取消标记：线程池中的线程只检查它，不调用 QThread 的方法
+        self._cancelled = threading.Event()
 
     def run(self):
-        def get_base_url(url, edit_sw=False):
-            base_url = url.split('/')[0] + '//' + url.split('/')[2]
-            if base_url.endswith('/'):
-                base_url = base_url[:-1]
-            if edit_sw and base_url.endswith('stackoverflow.com'):
-                base_url = 'https://stackoverflow.co'
-            NO_SSL_VERIFY_DOMAINS = [
-                'github.com',
-                'steamcommunity.com',
-                'store.steampowered.com'
-            ]
-            ssl_verify = not any(base_url.endswith(d) for d in NO_SSL_VERIFY_DOMAINS)
-            return (base_url, ssl_verify)
-
-        # 对每个启用的搜索引擎按其配置的 URL 发起请求，顺序请求
-        engines = list(self.api_manager.search_engines.items())
-        for name, cfg in engines:
-            if not cfg.get('enabled'):
-                continue
-            api_url = cfg.get('api_url') or ''
-            api_key = cfg.get('api_key', '')
-            results_path = cfg.get('results_path', '') or ''
-            # json 字段映射
-            json_title_key = cfg.get('json_title', '')
-            json_url_key = cfg.get('json_url', '')
-            json_snippet_key = cfg.get('json_snippet', '')
-            json_publish_key = cfg.get('json_publish_date', '')
-            json_header_key = cfg.get('json_keyheader', '')
-            if not api_url:
-                continue
-            # 构建请求 URL：支持包含 {query} 和 {apikey} 占位符
-            # 构建请求 URL：支持包含 {query} 和 {apikey} 占位符
-            try:
-                t = get_base_url(api_url)
-                base_url, ssl_verify = t
-                req_url = api_url
-                # 支持多种占位符，避免只识别 {query} 导致重复追加参数
-                query_placeholders = ['{query}', '{q}', '{keyword}', '{search}']
-                apikey_placeholders = ['{apikey}', '{api_key}', '{key}']
-
-                replaced_query = False
-                for ph in query_placeholders:
-                    if ph in req_url:
-                        req_url = req_url.replace(ph, quote_plus(self.query))
-                        replaced_query = True
-
-                for ph in apikey_placeholders:
-                    if ph in req_url:
-                        req_url = req_url.replace(ph, quote_plus(api_key))
-
-                # 如果没有任何占位符被替换，且 URL 查询串中也没有 q/keyword/query/search 等参数，则再追加参数
-                if not replaced_query:
-                    parsed = urlparse(req_url)
-                    existing_q = (parsed.query or '').lower()
-                    if not any(k in existing_q for k in ('q=', 'keyword=', 'query=', 'search=')):
-                        sep = '&' if '?' in req_url else '?'
-                        req_url = f"{req_url}{sep}q={quote_plus(self.query)}"
-
-                # 设置请求头API Key（如果配置了 header key）
-                header = {}
-                if json_header_key:
-                    header = {json_header_key: api_key}
+        engines = [(name, cfg) for name, cfg in list(self.api_manager.search_engines.items())
+                   if cfg.get('enabled') and cfg.get('api_url')]
+        if not engines:
+            return
 
-                try:
-                    resp = requests.get(req_url, timeout=(15,20), headers=header, verify=ssl_verify)
-                except Exception as e:
-                    # 网络或请求错误 -> 发出错误信号并继续下一个引擎
+        self._session = self._make_session(len(engines))
+        # 每个引擎一个线程，引擎之间并发请求
+        self._engine_pool = _DaemonPool(len(engines))
+        try:
+            self._engine_futures = {self._engine_pool.submit(self._fetch_engine, name, cfg): name for name, cfg in engines}
+            pending = set(self._engine_futures)
+            # 各引擎自行分批发回结果，这里等待它们结束并上报异常，期间定期检查是否被取消
+            while pending and not self._cancelled.is_set():
+                done, pending = wait(pending, timeout=self.POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if self._cancelled.is_set():
+                        break
+                    name = self._engine_futures[future]
                     try:
-                        self.error_occurred.emit(f"引擎 {name} 请求失败: {repr(e)}")
-                    except Exception:
-                        pass
-                    continue
+                        future.result()
+                    except Exception as e:
+                        # 发生未知错误，发出错误信号并继续
+                        self._emit_error(f"引擎 {name} 未知错误: {repr(e)}")
+        finally:
+            self._close_session()
+            # 线程做完手头的任务就退出，不会在每次搜索后留下空闲线程
+            self._engine_pool.shutdown()
+            self._icon_pool.shutdown()
+
+    def _make_session(self, engine_count):
+        """创建本次搜索共用的 Session。
+
+        连接池大小覆盖所有并发的引擎和图标请求，避免池满后丢弃连接、
+        对同一主机重复做 TCP/TLS 握手。
+        """
+        session = requests.Session()
+        pool_size = engine_count + self.ICON_WORKERS
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _emit_results(self, results):
+        """发出一批结果；已取消的搜索不再发出。"""
+        if self._cancelled.is_set():
+            return
+        try:
+            self.results_ready.emit(results)
+        except Exception:
+            pass
+
+    def _emit_error(self, message):
+        """发出错误信号；已取消的搜索不再上报错误。"""
+        if self._cancelled.is_set():
+            return
+        try:
+            self.error_occurred.emit(message)
+        except Exception:
+            pass
 
-                # 试着解析 JSON
-                results = []
+    def _close_session(self):
+        try:
+            if self._session is not None:
+                self._session.close()
+        except Exception:
+            pass
+
+    def _fetch_engine(self, name, cfg):
+        """请求单个搜索引擎，解析后分批通过 results_ready 发回（在守护线程中执行）。"""
+        api_url = cfg.get('api_url') or ''
+        api_key = cfg.get('api_key', '')
+        results_path = cfg.get('results_path', '') or ''
+        # json 字段映射
+        json_title_key = cfg.get('json_title', '')
+        json_url_key = cfg.get('json_url', '')
+        json_snippet_key = cfg.get('json_snippet', '')
+        json_publish_key = cfg.get('json_publish_date', '')
+        json_header_key = cfg.get('json_keyheader', '')
+
+        # 构建请求 URL：支持包含 {query} 和 {apikey} 占位符
+        base_url, ssl_verify = _get_base_url(api_url)
+        req_url = api_url
+        # 支持多种占位符，避免只识别 {query} 导致重复追加参数
+        query_placeholders = ['{query}', '{q}', '{keyword}', '{search}']
+        apikey_placeholders = ['{apikey}', '{api_key}', '{key}']
+
+        replaced_query = False
+        for ph in query_placeholders:
+            if ph in req_url:
+                req_url = req_url.replace(ph, quote_plus(self.query))
+                replaced_query = True
+
+        for ph in apikey_placeholders:
+            if ph in req_url:
+                req_url = req_url.replace(ph, quote_plus(api_key))
+
+        # 如果没有任何占位符被替换，且 URL 查询串中也没有 q/keyword/query/search 等参数，则再追加参数
+        if not replaced_query:
+            parsed = urlparse(req_url)
+            existing_q = (parsed.query or '').lower()
+            if not any(k in existing_q for k in ('q=', 'keyword=', 'query=', 'search=')):
+                sep = '&' if '?' in req_url else '?'
+                req_url = f"{req_url}{sep}q={quote_plus(self.query)}"
+
+        # 设置请求头API Key（如果配置了 header key）
+        header = {}
+        if json_header_key:
+            header = {json_header_key: api_key}
+
+        try:
+            resp = self._session.get(req_url, timeout=(15,20), headers=header, verify=ssl_verify)
+        except Exception as e:
+            # 网络或请求错误 -> 发出错误信号并继续下一个引擎
+            self._emit_error(f"引擎 {name} 请求失败: {repr(e)}")
+            return
+
+        # 试着解析 JSON：先直接解析原始字节（orjson 更快），非 UTF-8 等情况再交给 requests 按编码解码
+        j = None
+        try:
+            j = json_loads(resp.content)
+        except Exception:
+            try:
+                j = resp.json()
+            except Exception:
                 j = None
-                try:
-                    j = resp.json()
-                except Exception:
-                    j = None
-
-                # 如果配置了 results_path，则按路径取值（支持 .a.b 语法）
-                def _get_by_path(obj, path):
-                    if not path:
-                        return obj
-                    if path == '.' or path == '':
-                        return obj
-                    # 去掉开头的点
-                    if path.startswith('.'):
-                        path = path[1:]
-                    parts = [p for p in path.split('.') if p]
-                    cur = obj
-                    try:
-                        for p in parts:
-                            if isinstance(cur, dict):
-                                cur = cur.get(p)
-                            elif isinstance(cur, list):
-                                # 不支持数字索引的复杂情况，返回空
-                                return None
-                            else:
-                                return None
-                        return cur
-                    except Exception:
-                        return None
-
-                items = []
-                if j is not None:
-                    if results_path:
-                        val = _get_by_path(j, results_path)
-                        if isinstance(val, list):
-                            items = val
-                        elif isinstance(val, dict):
-                            items = [val]
-                        else:
-                            items = []
+
+        # 如果配置了 results_path，则按路径取值（支持 .a.b 语法）
+        items = []
+        if j is not None:
+            if results_path:
+                val = _compile_json_path(results_path)(j)
+                if isinstance(val, list):
+                    items = val
+                elif isinstance(val, dict):
+                    items = [val]
+                else:
+                    items = []
+            else:
+                # 兼容常见返回格式
+                if isinstance(j, dict):
+                    if 'results' in j and isinstance(j['results'], list):
+                        items = j['results']
+                    elif 'items' in j and isinstance(j['items'], list):
+                        items = j['items']
                     else:
-                        # 兼容常见返回格式
-                        if isinstance(j, dict):
-                            if 'results' in j and isinstance(j['results'], list):
-                                items = j['results']
-                            elif 'items' in j and isinstance(j['items'], list):
-                                items = j['items']
-                            else:
-                                items = [j]
-                        elif isinstance(j, list):
-                            items = j
-                        else:
-                            items = []
+                        items = [j]
+                elif isinstance(j, list):
+                    items = j
                 else:
                     items = []
-
-                for it in items:
-                    # 规范化字段并支持按配置的 json key 提取
-                    title = ''
+        else:
+            items = []
+
+        # 先解析全部条目并提交图标请求，再统一等待图标，使图标请求并发进行
+        pending = []
+        for it in items:
+            # 规范化字段并支持按配置的 json key 提取
+            title = ''
+            url = ''
+            snippet = ''
+            pd = None
+            try:
+                if isinstance(it, dict):
+                    title = it.get(json_title_key) or it.get('title') or ''
+                    url = it.get(json_url_key) or it.get('url') or ''
+                    snippet = it.get(json_snippet_key) or it.get('snippet') or ''
+                    pd = it.get(json_publish_key) or it.get('publish_date')
+                else:
+                    title = str(it)
+                    snippet = str(it)
                     url = ''
-                    snippet = ''
-                    publish_date = None
-                    try:
-                        if isinstance(it, dict):
-                            title = it.get(json_title_key) or it.get('title') or ''
-                            url = it.get(json_url_key) or it.get('url') or ''
-                            snippet = it.get(json_snippet_key) or it.get('snippet') or ''
-                            pd = it.get(json_publish_key) or it.get('publish_date')
-                            if pd is not None:
-                                try:
-                                    publish_date = normalize_publish_date(pd)
-                                except Exception:
-                                    publish_date = None
-                        else:
-                            title = str(it)
-                            snippet = str(it)
-                            url = ''
-                    except Exception as e:
-                        # 如果解析单条记录出问题，记录并跳过该条
-                        try:
-                            self.error_occurred.emit(f"引擎 {name} 解析结果项出错: {repr(e)}")
-                        except Exception:
-                            pass
-                        continue
-
-                    # 只有 title 字段缺失或为空时才兜底
-                    result_title = title if title else f"{name} result"
-                    norm_url = canonicalize_url(url or '')
-
-                    # 获取ICON
-                    icon = None
-                    if url:
-                        t = get_base_url(url, True)
-                        base_url, ssl_verify = t
-                        icon = self.api_manager.iconcache.get_icon(base_url)
-                        if not icon:
-                            try:
-                                headers = {'User-Agent':'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'}
-                                icon_url = get(base_url, timeout=(10, 5), headers=headers, verify=ssl_verify)
-                                if icon_url:
-                                    icon_req = requests.get(icon_url[0].url, timeout=(10, 5), headers=headers, verify=ssl_verify)
-                                    if icon_req.status_code == 200:
-                                        image_mime_types = [
-                                            'image/x-icon',
-                                            'image/vnd.microsoft.icon',
-                                            'image/png',
-                                            'image/jpeg',
-                                            'image/jpg',
-                                            'image/gif',
-                                            'image/bmp',
-                                            'image/svg+xml',
-                                            'image/webp'
-                                        ]
-                                        content_type = icon_req.headers.get('Content-Type', '').lower()
-                                        if any(mime_type in content_type for mime_type in image_mime_types):
-                                            icon_data = QPixmap()
-                                            icon_data.loadFromData(icon_req.content)
-                                            icon = QIcon(icon_data)
-                                            self.api_manager.iconcache.add_icon(base_url, icon)
-                            except Exception:
-                                pass
-
-                    result = {'title': result_title, 'url': url or '', 'norm_url': norm_url, 'snippet': snippet or '', 'source': name, 'publish_date': publish_date, 'icon': icon}
-                    # 计算权重
-                    result['weight'] = self.api_manager.calculate_weight(result)
-                    # 白名单标记
-                    try:
-                        domain = ''
-                        if url:
-                            domain = urlparse(url).netloc.lower()
-                        result['is_whitelist'] = any(w in domain for w in self.api_manager.whitelist)
-                    except Exception:
-                        result['is_whitelist'] = False
-                    results.append(result)
-
-                # 发回该引擎的结果（可能为空）
-                if results:
-                    self.results_ready.emit(results)
             except Exception as e:
-                # 发生未知错误，发出错误信号并继续
+                # 如果解析单条记录出问题，记录并跳过该条
+                self._emit_error(f"引擎 {name} 解析结果项出错: {repr(e)}")
+                continue
+
+            # 接口返回的字段不一定是字符串（数字、列表等），统一转成字符串再使用；
+            # 标题和简介常带高亮标签和 HTML 实体，卡片按纯文本绘制，这里先转成纯文本
+            title = html_to_text(str(title or ''))
+            url = str(url or '')
+            snippet = html_to_text(str(snippet or ''))
+
+            # 只有 title 字段缺失或为空时才兜底
+            result_title = title if title else f"{name} result"
+            # 只解析一次 URL，规范化和白名单判断共用同一个解析结果
+            parsed = None
+            if url:
                 try:
-                    self.error_occurred.emit(f"引擎 {name} 未知错误: {repr(e)}")
+                    parsed = _cached_urlparse(url)
                 except Exception:
-                    pass
+                    parsed = None
+            domain = parsed.netloc.lower() if parsed is not None else ''
+            # 命中黑名单的结果直接丢弃，不再解析日期、请求图标或计算权重
+            if self.api_manager.is_blacklisted(domain):
                 continue
+            # 规范化结果按 URL 缓存，同一 URL 再次出现（其他引擎、下次搜索）时直接命中
+            norm_url = canonicalize_url(url) if parsed is not None else (url or '')
+
+            publish_date = None
+            if pd is not None:
+                try:
+                    publish_date = normalize_publish_date(pd)
+                except Exception:
+                    publish_date = None
+
+            # 获取ICON（按站点 origin 异步提交，稍后统一取结果）
+            # 没有主机名（相对地址等）的结果无从获取图标，直接跳过
+            icon_future = self._request_icon(parsed) if parsed is not None and parsed.netloc else None
+
+            sort_ts = 0.0
+            if publish_date is not None:
+                try:
+                    sort_ts = publish_date.timestamp()
+                except Exception:
+                    sort_ts = 0.0
+
+            result = SearchResult(result_title, url, snippet, name, publish_date, norm_url, sort_ts=sort_ts)
+            # 白名单标记
+            try:
+                result.is_whitelist = self.api_manager.is_whitelisted(domain)
+            except Exception:
+                result.is_whitelist = False
+            pending.append((result, icon_future))
+
+        # 整批计算权重（黑名单结果已在上面过滤掉）
+        # 权重和更新时间文字共用同一个当前时间，都在后台线程算好
+        now = datetime.now()
+        weights = self.api_manager.calculate_weights([result for result, _ in pending], now)
+        # 每凑满 BATCH_SIZE 条就先发回，界面不必等整个引擎的图标全部到齐
+        batch = []
+        for (result, icon_future), weight in zip(pending, weights):
+            if self._cancelled.is_set():
+                return
+            result.weight = float(weight)
+            result.time_text = format_publish_time(result.publish_date, now)
+            if icon_future is not None:
+                try:
+                    result.icon = icon_future.result()
+                except Exception:
+                    result.icon = None
+            batch.append(result)
+            if len(batch) >= self.BATCH_SIZE:
+                self._emit_results(batch)
+                batch = []
+        if batch:
+            self._emit_results(batch)
+
+    def _request_icon(self, parsed):
+        """提交图标请求，同一站点在本次搜索中只请求一次，返回 Future。"""
+        origin, ssl_verify = _site_origin(parsed, True)
+        with self._icon_lock:
+            future = self._icon_futures.get(origin)
+            if future is None:
+                hit, cached = self.api_manager.iconcache.lookup(origin)
+                if hit or self._cancelled.is_set():
+                    future = Future()
+                    future.set_result(cached)
+                else:
+                    future = self._icon_pool.submit(self._fetch_icon, origin, ssl_verify)
+                self._icon_futures[origin] = future
+        return future
+
+    def _fetch_icon(self, origin, ssl_verify):
+        """下载站点图标并写入缓存，失败返回 None。
+
+        站点明确没有可用图标时缓存 None，网络异常则不缓存，下次搜索再重试。
+        """
+        icon = None
+        try:
+            icon_url = get(origin, timeout=(10, 5), headers=ICON_HEADERS, verify=ssl_verify)
+            if icon_url:
+                icon_req = self._session.get(icon_url[0].url, timeout=(10, 5), headers=ICON_HEADERS, verify=ssl_verify)
+                if icon_req.status_code == 200:
+                    content_type = icon_req.headers.get('Content-Type', '').lower()
+                    if any(mime_type in content_type for mime_type in IMAGE_MIME_TYPES):
+                        # 后台线程只能用 QImage；按两倍图标尺寸缩放好，高分屏下也清晰
+                        icon_data = QImage()
+                        if icon_data.loadFromData(icon_req.content):
+                            size = 2 * ResultCardDelegate.ICON_SIZE
+                            icon = icon_data.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            self.api_manager.iconcache.add_icon(origin, icon)
+        except Exception:
+            pass
+        return icon
 
     def stop(self):
-        self.terminate()
+        """请求取消搜索：丢弃排队中的请求并关闭 Session 的空闲连接，不强杀线程。
+
+        已经在进行的请求会跑到完成或超时，结果被丢弃。
+        """
+        self._cancelled.set()
+        self.requestInterruption()
+        for future in list(self._engine_futures):
+            future.cancel()
+        with self._icon_lock:
+            for future in self._icon_futures.values():
+                future.cancel()
+        self._close_session()
+
+    def is_idle(self):
+        """run() 已返回且线程池中的任务都已结束，此后不会再有线程访问这个 worker。"""
+        if self.isRunning():
+            return False
+        with self._icon_lock:
+            futures = list(self._icon_futures.values())
+        futures.extend(self._engine_futures)
+        return all(future.done() for future in futures)
+
+
+# 加载动画只有三种状态，预先生成好
+_DOT_STATES = ("●○○", "○●○", "○○●")
+
 
 class LoadingDots(QLabel):
     def __init__(self):
@@ -628,171 +1053,526 @@ class LoadingDots(QLabel):
         self.update_dots()
     
     def update_dots(self):
-        dots_text = []
-        for i in range(3):
-            if i == self.dots:
-                dots_text.append("●")
-            else:
-                dots_text.append("○")
-        text = "".join(dots_text)
-        self.setText(text)
-        # 更新显示
+        self.setText(_DOT_STATES[self.dots])
+
+
+# 搜索结果卡片中随主题变化的颜色
+_STYLES = {
+    'light': {
+        'background': "#ffffff",
+        'border': "#e0e0e0",
+        'hover': "#4285f4",
+        'snippet': "#545454",
+        'source': "#767676",
+        'time': "#767676",
+    },
+    'dark': {
+        'background': "#303134",
+        'border': "#5f6368",
+        'hover': "#8ab4f8",
+        'snippet': "#bdc1c6",
+        'source': "#9aa0a6",
+        'time': "#9aa0a6",
+    },
+}
+
+
+def format_publish_time(publish_date, now=None) -> str:
+    """把发布时间显示为 今天/昨天/N天前/日期，无法识别时返回“未知”。now 为本地 naive 时间。"""
+    if not isinstance(publish_date, datetime):
+        return "未知"
+    try:
+        if now is None:
+            now = datetime.now()
+        # 若 publish_date 是时区感知（aware），则把当前时间换算到相同时区
+        if getattr(publish_date, 'tzinfo', None) is not None and publish_date.tzinfo.utcoffset(publish_date) is not None:
+            now = now.astimezone(publish_date.tzinfo)
+        time_diff = now - publish_date
+        if time_diff.days == 0:
+            return "今天"
+        if time_diff.days == 1:
+            return "昨天"
+        if time_diff.days < 7:
+            return f"{time_diff.days}天前"
+        return publish_date.strftime("%Y-%m-%d")
+    except Exception:
+        return "未知"
 
-class SearchResultWidget(QWidget):
-    def __init__(self, result_data, theme="light"):
-        super().__init__()
-        self.result_data = result_data
+
+class SearchResultsModel(QAbstractListModel):
+    """本次搜索全部结果的列表模型，行数据就是 SearchResult，按排序键降序排列。"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        result = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return result.title
+        if role == Qt.ToolTipRole:
+            return result.url
+        return None
+
+    def result_at(self, row):
+        return self._rows[row]
+
+    def set_rows(self, rows):
+        """整体替换显示的结果。"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def merge_rows(self, rows, key):
+        """把已按 key 降序排好的新结果归并进来。
+
+        按新结果在归并后所处的连续段逐段通知插入，而不是重置模型，视图的滚动位置保持不变。
+        """
+        if not rows:
+            return
+        merged = list(heapq.merge(self._rows, rows, key=key, reverse=True))
+        new_ids = {id(r) for r in rows}
+        row = 0
+        while row < len(merged):
+            if id(merged[row]) not in new_ids:
+                row += 1
+                continue
+            end = row
+            while end < len(merged) and id(merged[end]) in new_ids:
+                end += 1
+            # 前面的段都已插入，此时 _rows[:row] 与 merged[:row] 一致
+            self.beginInsertRows(QModelIndex(), row, end - 1)
+            self._rows[row:row] = merged[row:end]
+            self.endInsertRows()
+            row = end
+
+
+class ResultCardDelegate(QStyledItemDelegate):
+    """把一条搜索结果直接画成卡片，不再为每条结果创建 QWidget。
+
+    卡片内容依次是：图标+标题、URL 和权重、简介、来源/更新时间/白名单徽标。
+    """
+
+    CARD_MARGIN = 5      # 卡片之间上下留白
+    PADDING_H = 15
+    PADDING_V = 10
+    SPACING = 5
+    ICON_SIZE = 24
+    SNIPPET_LINES = 2    # 简介最多显示的行数，超出部分省略，所有卡片因此等高
+
+    def __init__(self, view, theme="light"):
+        super().__init__(view)
+        self.view = view
         self.theme = theme
-        self.setup_ui()
-        
-    def setup_ui(self):
-        layout = QVBoxLayout()
-        layout.setContentsMargins(15, 10, 15, 10)
-        layout.setSpacing(5)
-
-        # 标题行
-        title_layout = QHBoxLayout()
-
-        # 图标（模拟）
-        icon_label = QLabel("🔍")
-        icon_label.setFixedSize(20, 20)
-        title_layout.addWidget(icon_label)
-
-        # 标题（蓝色） — 使用显式的 inline 样式并保存为实例属性
-        self.title_label = QLabel()
-        self.title_label.setText(f"<img src={icon_to_base64(self.result_data.get('icon')) if self.result_data.get('icon', None) else icon_to_base64(QIcon(get_source_path('defaulticon')))} width='24' height='24'> {str(self.result_data.get("title", ""))}")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        self.title_label.setFont(title_font)
-        # 使用明确的 inline stylesheet 来确保颜色优先级高
-        self.title_label.setStyleSheet("color: #00FFFF; font-size:14px; background: transparent;")
-        title_layout.addWidget(self.title_label)
-        title_layout.addStretch()
-        layout.addLayout(title_layout)
-
-        # URL和权重
-        url_layout = QHBoxLayout()
-        # URL（灰色） — 显式 inline 样式
-        self.url_label = QLabel(str(self.result_data.get("url", "")))
-        self.url_label.setStyleSheet("color: #767676; font-size:12px; background: transparent;")
-        url_layout.addWidget(self.url_label)
-        url_layout.addStretch()
-
-        # 权重显示
-        weight_label = QLabel(f"权重: {self.result_data.get('weight', 0.0):.1f}")
-        weight_label.setStyleSheet("color: #666; font-size: 11px;")
-        url_layout.addWidget(weight_label)
-
-        layout.addLayout(url_layout)
-
-        # 简介
-        snippet_label = QLabel(str(self.result_data.get("snippet", "")))
-        snippet_label.setStyleSheet("color: #545454; font-size: 13px;" if self.theme == "light" else "color: #bdc1c6; font-size: 13px;")
-        snippet_label.setWordWrap(True)
-        layout.addWidget(snippet_label)
-
-        # 来源和时间
-        info_layout = QHBoxLayout()
-
-        # 来源
-        source_label = QLabel(f"来源: {self.result_data.get('source', '')}")
-        source_label.setStyleSheet("color: #767676; font-size: 11px;" if self.theme == "light" else "color: #9aa0a6; font-size: 11px;")
-        info_layout.addWidget(source_label)
-
-        info_layout.addStretch()
-
-        # 更新时间
-        publish_date = self.result_data.get("publish_date", None)
-        time_text = "未知"
-        if isinstance(publish_date, datetime):
-            try:
-                # 若 publish_date 是时区感知（aware），则用相同时区获取当前时间
-                if getattr(publish_date, 'tzinfo', None) is not None and publish_date.tzinfo.utcoffset(publish_date) is not None:
-                    now = datetime.now(tz=publish_date.tzinfo)
-                else:
-                    now = datetime.now()
-                time_diff = now - publish_date
-                if time_diff.days == 0:
-                    time_text = "今天"
-                elif time_diff.days == 1:
-                    time_text = "昨天"
-                elif time_diff.days < 7:
-                    time_text = f"{time_diff.days}天前"
-                else:
-                    time_text = publish_date.strftime("%Y-%m-%d")
-            except Exception:
-                time_text = "未知"
+        base = view.font()
+        self.title_font = self._pixel_font(base, 14)
+        self.url_font = self._pixel_font(base, 12)
+        self.weight_font = self._pixel_font(base, 11)
+        self.snippet_font = self._pixel_font(base, 13)
+        self.info_font = self._pixel_font(base, 11)
+        self.badge_font = self._pixel_font(base, 11)
+        self.badge_font.setBold(True)
+        # 简介省略后的文字按 (简介, 宽度) 缓存，重绘时不用重新计算
+        self._snippet_fm = QFontMetrics(self.snippet_font)
+        self._snippet_text = functools.lru_cache(maxsize=1024)(self._elide_snippet)
+        # 卡片高度只取决于字体，算一次即可（配合视图的 uniformItemSizes）
+        self._snippet_h = self.SNIPPET_LINES * self._snippet_fm.lineSpacing()
+        title_h = max(self.ICON_SIZE, QFontMetrics(self.title_font).height())
+        url_h = max(QFontMetrics(self.url_font).height(), QFontMetrics(self.weight_font).height())
+        info_h = QFontMetrics(self.info_font).height() + 4
+        self._card_height = (2 * self.CARD_MARGIN + 2 * self.PADDING_V + title_h + url_h + self._snippet_h
+                             + info_h + 3 * self.SPACING)
+
+    @staticmethod
+    def _pixel_font(base, size):
+        font = QFont(base)
+        font.setPixelSize(size)
+        return font
+
+    def _elide_snippet(self, snippet, width):
+        """把简介排成最多 SNIPPET_LINES 行：前面几行按词换行排满，剩下的文字放进最后一行并省略。"""
+        # 换行符等空白统一成单个空格，行数只由宽度决定
+        text = ' '.join(snippet.split())
+        # QTextLayout 的位置以 UTF-16 码元计，按 UTF-16 编码切片，避免表情等字符错位
+        data = text.encode('utf-16-le')
+        layout = QTextLayout(text, self.snippet_font)
+        lines = []
+        end = 0
+        layout.beginLayout()
+        for _ in range(self.SNIPPET_LINES - 1):
+            line = layout.createLine()
+            if not line.isValid():
+                break
+            line.setLineWidth(width)
+            start, end = line.textStart(), line.textStart() + line.textLength()
+            lines.append(data[2 * start:2 * end].decode('utf-16-le').rstrip())
+        layout.endLayout()
+        rest = data[2 * end:].decode('utf-16-le').strip()
+        if rest:
+            lines.append(self._snippet_fm.elidedText(rest, Qt.ElideRight, width))
+        return '\n'.join(lines)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width() or self.view.viewport().width(), self._card_height)
+
+    def paint(self, painter, option, index):
+        result = index.model().result_at(index.row())
+        # 绘制中途出错也要恢复画笔状态，否则 painter.save() 不配对
+        painter.save()
+        try:
+            self._paint_card(painter, option, result)
+        finally:
+            painter.restore()
+
+    def _paint_card(self, painter, option, result):
+        colors = _STYLES['light' if self.theme == "light" else 'dark']
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # 卡片背景和边框，鼠标悬停时高亮边框
+        card = option.rect.adjusted(0, self.CARD_MARGIN, -1, -self.CARD_MARGIN)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        painter.setPen(QPen(QColor(colors['hover'] if hovered else colors['border']), 1))
+        painter.setBrush(QColor(colors['background']))
+        painter.drawRoundedRect(QRectF(card).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+
+        x = card.left() + self.PADDING_H
+        width = card.width() - 2 * self.PADDING_H
+        y = card.top() + self.PADDING_V
+
+        # 标题行：站点图标 + 标题
+        title_fm = QFontMetrics(self.title_font)
+        title_h = max(self.ICON_SIZE, title_fm.height())
+        icon_rect = QRect(x, y + (title_h - self.ICON_SIZE) // 2, self.ICON_SIZE, self.ICON_SIZE)
+        if result.icon is not None:
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            painter.drawImage(icon_rect, result.icon)
+        else:
+            default_icon().paint(painter, icon_rect)
+        title_x = x + self.ICON_SIZE + 4
+        title_w = width - self.ICON_SIZE - 4
+        title = title_fm.elidedText(result.title, Qt.ElideRight, title_w)
+        painter.setFont(self.title_font)
+        painter.setPen(QColor("#00FFFF"))
+        painter.drawText(QRect(title_x, y, title_w, title_h), Qt.AlignLeft | Qt.AlignVCenter, title)
+        y += title_h + self.SPACING
+
+        # URL 和权重
+        url_fm = QFontMetrics(self.url_font)
+        weight_fm = QFontMetrics(self.weight_font)
+        url_h = max(url_fm.height(), weight_fm.height())
+        weight_text = f"权重: {result.weight:.1f}"
+        weight_w = weight_fm.horizontalAdvance(weight_text)
+        painter.setFont(self.weight_font)
+        painter.setPen(QColor("#666"))
+        painter.drawText(QRect(x + width - weight_w, y, weight_w, url_h), Qt.AlignRight | Qt.AlignVCenter, weight_text)
+        url = url_fm.elidedText(result.url, Qt.ElideRight, max(width - weight_w - 10, 0))
+        painter.setFont(self.url_font)
+        painter.setPen(QColor("#767676"))
+        painter.drawText(QRect(x, y, width - weight_w - 10, url_h), Qt.AlignLeft | Qt.AlignVCenter, url)
+        y += url_h + self.SPACING
+
+        # 简介（自动换行，最多 SNIPPET_LINES 行）
+        if result.snippet:
+            painter.setFont(self.snippet_font)
+            painter.setPen(QColor(colors['snippet']))
+            painter.drawText(QRect(x, y, width, self._snippet_h), Qt.AlignLeft | Qt.AlignTop,
+                             self._snippet_text(result.snippet, width))
+        y += self._snippet_h + self.SPACING
+
+        # 来源、更新时间和白名单徽标
+        info_fm = QFontMetrics(self.info_font)
+        info_h = info_fm.height() + 4
+        painter.setFont(self.info_font)
+        painter.setPen(QColor(colors['source']))
+        painter.drawText(QRect(x, y, width, info_h), Qt.AlignLeft | Qt.AlignVCenter, f"来源: {result.source}")
+        right = x + width
+        if result.is_whitelist:
+            badge_fm = QFontMetrics(self.badge_font)
+            badge_w = badge_fm.horizontalAdvance("白名单") + 16
+            badge = QRect(right - badge_w, y, badge_w, info_h)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor("gold"))
+            painter.drawRoundedRect(QRectF(badge), 4, 4)
+            painter.setFont(self.badge_font)
+            painter.setPen(QColor("black"))
+            painter.drawText(badge, Qt.AlignCenter, "白名单")
+            right -= badge_w + 6
+        time_text = f"更新时间: {result.time_text}"
+        painter.setFont(self.info_font)
+        painter.setPen(QColor(colors['time']))
+        painter.drawText(QRect(x, y, right - x, info_h), Qt.AlignRight | Qt.AlignVCenter, time_text)
+
+
+# 全局样式表：控件按 objectName 区分，切换主题时只替换一次整个应用的样式
+_BASE_QSS = """
+QLabel#logo_label {
+    font-size: 36px;
+    font-weight: bold;
+    color: #4285f4;
+    margin-bottom: 10px;
+}
+QLineEdit#search_input {
+    border: 2px solid #dfe1e5;
+    border-radius: 20px;
+    padding: 0px 15px;
+    font-size: 14px;
+    background-color: white;
+    color: black;
+}
+QLineEdit#search_input:focus {
+    border-color: #4285f4;
+}
+QPushButton#search_btn {
+    background-color: #4285f4;
+    border: none;
+    border-radius: 20px;
+    color: white;
+    font-size: 16px;
+}
+QPushButton#search_btn:hover {
+    background-color: #3367d6;
+}
+QListView#results_view {
+    border: none;
+    background-color: transparent;
+}
+QLabel#loading_dots {
+    font-size: 20px;
+    color: #4285f4;
+}
+QLabel#settings_title {
+    font-size: 18px;
+    font-weight: bold;
+    padding: 15px 20px;
+    background-color: transparent;
+}
+QLabel#page_title {
+    font-size: 24px;
+    font-weight: bold;
+    margin-bottom: 20px;
+}
+QLabel#section_title {
+    font-size: 16px;
+    font-weight: bold;
+    margin-top: 20px;
+}
+QPushButton#nav_button {
+    text-align: left;
+    padding: 12px 20px;
+    border: none;
+    background-color: transparent;
+    color: #666;
+    font-size: 14px;
+    border-radius: 0px;
+}
+QPushButton#nav_button:hover {
+    background-color: #e8f0fe;
+    color: #1a73e8;
+}
+QPushButton#nav_button[selected="true"] {
+    background-color: #1a73e8;
+    color: white;
+}
+"""
+
+LIGHT_QSS = """
+QMainWindow, QWidget {
+    background-color: white;
+    color: black;
+}
+QPushButton#settings_btn {
+    background-color: transparent;
+    border: 2px solid #dfe1e5;
+    border-radius: 20px;
+    font-size: 16px;
+}
+QPushButton#settings_btn:hover {
+    background-color: #f8f9fa;
+}
+QWidget#sidebar {
+    background-color: #f8f9fa;
+    border-right: 1px solid #e0e0e0;
+}
+QLabel#settings_title, QLabel#page_title, QLabel#section_title {
+    color: #333;
+}
+QStackedWidget#content_stack {
+    background-color: white;
+}
+QTableView, QListView#domain_list {
+    background-color: white;
+    color: black;
+}
+""" + _BASE_QSS
+
+DARK_QSS = """
+QMainWindow, QWidget {
+    background-color: #202124;
+    color: #e8eaed;
+}
+QPushButton#settings_btn {
+    background-color: transparent;
+    border: 2px solid #5f6368;
+    border-radius: 20px;
+    font-size: 16px;
+    color: #e8eaed;
+}
+QPushButton#settings_btn:hover {
+    background-color: #303134;
+}
+QWidget#sidebar {
+    background-color: #303134;
+    border-right: 1px solid #5f6368;
+}
+QLabel#settings_title, QLabel#page_title, QLabel#section_title {
+    color: #e8eaed;
+}
+QStackedWidget#content_stack {
+    background-color: #303134;
+}
+QTableView, QListView#domain_list {
+    background-color: #303134;
+    color: #e8eaed;
+}
+""" + _BASE_QSS
+
+
+def apply_app_stylesheet(theme):
+    """按主题设置整个应用的样式表，除 light 外都按深色处理。"""
+    app = QApplication.instance()
+    if app is None:
+        return
+    qss = LIGHT_QSS if theme == "light" else DARK_QSS
+    # 样式表没变时不重新设置，避免 Qt 重新解析并刷新所有控件的样式
+    if app.styleSheet() != qss:
+        app.setStyleSheet(qss)
+
+
+class ApiEnginesModel(QAbstractTableModel):
+    """搜索引擎 API 表格的数据模型。
+
+    每行保存 [名称, 配置 dict]，配置 dict 与 api_manager.search_engines 中的是同一个对象，
+    修改普通列时直接改配置；改名、增删行时按表格顺序重建 search_engines。
+    """
 
-        time_label = QLabel(f"更新时间: {time_text}")
-        time_label.setStyleSheet("color: #767676; font-size: 11px;" if self.theme == "light" else "color: #9aa0a6; font-size: 11px;")
-        info_layout.addWidget(time_label)
+    # (表头, 配置中的键)，第 0 列是引擎名称本身，其余列依次对应 ENGINE_FIELDS
+    COLUMNS = (("名称", None),) + tuple(zip(
+        ("APIURL", "APIKEY", "结果列表路径", "title键", "url键", "snippet键", "publish_date键", "APIKEY头名"),
+        ENGINE_FIELDS))
 
-        # 白名单徽标
-        if self.result_data.get('is_whitelist', False):
-            badge = QLabel("白名单")
-            badge.setStyleSheet("background: gold; color: black; border-radius: 4px; padding: 2px 8px; font-weight: bold; font-size: 11px;")
-            info_layout.addWidget(badge)
+    changed = Signal()
 
-        layout.addLayout(info_layout)
+    def __init__(self, api_manager, parent=None):
+        super().__init__(parent)
+        self.api_manager = api_manager
+        self._rows = [[name, cfg] for name, cfg in api_manager.search_engines.items()]
 
-        self.setLayout(layout)
-        self.update_theme()
-        # 让整个 SearchResultWidget 可点击：子部件不接收鼠标，以便父 widget 接收点击
-        for child in (icon_label, getattr(self, 'title_label', None), getattr(self, 'url_label', None), snippet_label, source_label, time_label, weight_label):
-            try:
-                if child is not None:
-                    child.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-            except Exception:
-                pass
-        self.setCursor(Qt.PointingHandCursor)
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
 
-    def mousePressEvent(self, event):
-        # 在父 widget 接收点击时打开 URL
-        url = str(self.result_data.get("url", ""))
-        if url:
-            try:
-                QDesktopServices.openUrl(QUrl(url))
-            except Exception:
-                pass
-        super().mousePressEvent(event)
-        
-    def update_theme(self):
-        if self.theme == "light":
-            self.setStyleSheet("""
-                SearchResultWidget {
-                    border: 1px solid #e0e0e0;
-                    border-radius: 8px;
-                    background-color: white;
-                    margin: 5px 0px;
-                }
-                SearchResultWidget:hover {
-                    border-color: #4285f4;
-                }
-            """)
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            name, cfg = self._rows[index.row()]
+            key = self.COLUMNS[index.column()][1]
+            return name if key is None else str(cfg.get(key, '') or '')
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section][0]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        value = str(value)
+        row = self._rows[index.row()]
+        key = self.COLUMNS[index.column()][1]
+        if key is None:
+            if value == row[0]:
+                return False
+            row[0] = value
+            self._sync_engines()
         else:
-            self.setStyleSheet("""
-                SearchResultWidget {
-                    border: 1px solid #5f6368;
-                    border-radius: 8px;
-                    background-color: #303134;
-                    margin: 5px 0px;
-                }
-                SearchResultWidget:hover {
-                    border-color: #8ab4f8;
-                }
-            """)
+            if value == row[1].get(key, ''):
+                return False
+            row[1][key] = value
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        self.changed.emit()
+        return True
+
+    def append_row(self):
+        row = len(self._rows)
+        cfg = dict(ENGINE_DEFAULTS)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(["", cfg])
+        self.endInsertRows()
+        self._sync_engines()
+        self.changed.emit()
+
+    def remove_row(self, row):
+        if not 0 <= row < len(self._rows):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+        self._sync_engines()
+        self.changed.emit()
+
+    def _sync_engines(self):
+        # 重名时后面的行覆盖前面的，与按表格逐行重建时一致
+        self.api_manager.search_engines = {name: cfg for name, cfg in self._rows}
+
+
+class ThemedColumnDelegate(QStyledItemDelegate):
+    """按当前主题给整列单元格着色，换主题时只需重绘视图。"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.dark = False
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        option.backgroundBrush = QBrush(QColor(Qt.black) if self.dark else QColor(Qt.white))
+        option.palette.setColor(QPalette.Text, QColor(Qt.white) if self.dark else QColor(Qt.black))
+
 
 class SettingsWindow(QMainWindow):
+    # 修改设置后延迟多久落盘（毫秒），连续编辑只写一次文件
+    SAVE_DELAY_MS = 500
+    # 导航键对应的页面构建方法，页面在第一次切换过去时才创建
+    _PAGE_BUILDERS = {"basic": "create_basic_page", "blacklist": "create_blacklist_page",
+                      "search_api": "create_search_api_page", "about": "create_about_page"}
+
     def __init__(self, api_manager, parent=None):
         super().__init__(parent)
         self.api_manager = api_manager
         self.current_nav_key = "basic"
+        self.theme = "light"
+        self._pages = {}
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._save_settings)
         self.setup_ui()
         self.apply_theme_to_settings(api_manager.theme_mode)
 
     def setup_ui(self):
         self.setWindowTitle("设置 - EasySearch")
-        self.setWindowIcon(QIcon(get_source_path("icon.ico")))
+        self.setWindowIcon(QIcon(ICON_PATH))
         self.setFixedSize(800, 600)
         
         central_widget = QWidget()
@@ -803,6 +1583,7 @@ class SettingsWindow(QMainWindow):
         
         # 左侧导航栏
         self.sidebar = QWidget()
+        self.sidebar.setObjectName("sidebar")
         self.sidebar.setFixedWidth(200)
         sidebar_layout = QVBoxLayout(self.sidebar)
         sidebar_layout.setContentsMargins(0, 20, 0, 20)
@@ -811,13 +1592,6 @@ class SettingsWindow(QMainWindow):
         # 设置标题
         settings_title = QLabel("设置")
         settings_title.setObjectName("settings_title")
-        settings_title.setStyleSheet("""
-            QLabel#settings_title {
-                font-size: 18px;
-                font-weight: bold;
-                padding: 15px 20px;
-            }
-        """)
         sidebar_layout.addWidget(settings_title)
         
         # 导航按钮
@@ -845,48 +1619,29 @@ class SettingsWindow(QMainWindow):
         self.content_stack = QStackedWidget()
         self.content_stack.setObjectName("content_stack")
         
-        # 创建各个设置页面
-        self.basic_page = self.create_basic_page()
-        self.blacklist_page = self.create_blacklist_page()
-        self.search_api_page = self.create_search_api_page()
-        self.about_page = self.create_about_page()
-        
-        self.content_stack.addWidget(self.basic_page)
-        self.content_stack.addWidget(self.blacklist_page)
-        self.content_stack.addWidget(self.search_api_page)
-        self.content_stack.addWidget(self.about_page)
-        
         main_layout.addWidget(self.content_stack)
         
-        # 默认选中基础设置
+        # 默认选中基础设置，其余页面等切换过去时再创建
+        self.show_page(self.current_nav_key)
         self.update_nav_style()
         
-    def create_basic_page(self):
+    def _make_page(self, title_text):
+        """创建设置页的容器和布局，并放好页面标题（样式来自全局样式表）"""
         widget = QWidget()
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(30, 30, 30, 30)
-        
-        title = QLabel("基础设置")
+
+        title = QLabel(title_text)
         title.setObjectName("page_title")
-        title.setStyleSheet("""
-            QLabel#page_title {
-                font-size: 24px;
-                font-weight: bold;
-                margin-bottom: 20px;
-            }
-        """)
         layout.addWidget(title)
+        return widget, layout
+
+    def create_basic_page(self):
+        widget, layout = self._make_page("基础设置")
         
         # 主题设置
         theme_label = QLabel("主题模式")
         theme_label.setObjectName("section_title")
-        theme_label.setStyleSheet("""
-            QLabel#section_title {
-                font-size: 16px;
-                font-weight: bold;
-                margin-top: 20px;
-            }
-        """)
         layout.addWidget(theme_label)
         
         self.theme_combo = QComboBox()
@@ -907,29 +1662,18 @@ class SettingsWindow(QMainWindow):
         return widget
     
     def create_blacklist_page(self):
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(30, 30, 30, 30)
-        
-        title = QLabel("黑白名单设置")
-        title.setObjectName("page_title")
-        layout.addWidget(title)
+        widget, layout = self._make_page("黑白名单设置")
         
         # 黑名单表格
         blacklist_label = QLabel("黑名单 - 这些网站将不会出现在搜索结果中")
         blacklist_label.setObjectName("section_title")
         layout.addWidget(blacklist_label)
         
-        self.blacklist_table = QTableWidget(0, 1)
-        self.blacklist_table.setHorizontalHeaderLabels(["域名"])
-        self.blacklist_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.blacklist_table.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed)
-        
-        # 填充现有黑名单
-        for domain in self.api_manager.blacklist:
-            row = self.blacklist_table.rowCount()
-            self.blacklist_table.insertRow(row)
-            self.blacklist_table.setItem(row, 0, QTableWidgetItem(domain))
+        self.blacklist_model = QStringListModel(list(self.api_manager.blacklist), self)
+        self.blacklist_view = QListView()
+        self.blacklist_view.setObjectName("domain_list")
+        self.blacklist_view.setModel(self.blacklist_model)
+        self.blacklist_view.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed)
         
         # 添加和删除按钮
         blacklist_btn_layout = QHBoxLayout()
@@ -942,7 +1686,7 @@ class SettingsWindow(QMainWindow):
         blacklist_btn_layout.addWidget(delete_blacklist_btn)
         blacklist_btn_layout.addStretch()
         
-        layout.addWidget(self.blacklist_table)
+        layout.addWidget(self.blacklist_view)
         layout.addLayout(blacklist_btn_layout)
         
         # 白名单表格
@@ -950,16 +1694,11 @@ class SettingsWindow(QMainWindow):
         whitelist_label.setObjectName("section_title")
         layout.addWidget(whitelist_label)
         
-        self.whitelist_table = QTableWidget(0, 1)
-        self.whitelist_table.setHorizontalHeaderLabels(["域名"])
-        self.whitelist_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.whitelist_table.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed)
-        
-        # 填充现有白名单
-        for domain in self.api_manager.whitelist:
-            row = self.whitelist_table.rowCount()
-            self.whitelist_table.insertRow(row)
-            self.whitelist_table.setItem(row, 0, QTableWidgetItem(domain))
+        self.whitelist_model = QStringListModel(list(self.api_manager.whitelist), self)
+        self.whitelist_view = QListView()
+        self.whitelist_view.setObjectName("domain_list")
+        self.whitelist_view.setModel(self.whitelist_model)
+        self.whitelist_view.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed)
         
         # 添加和删除按钮
         whitelist_btn_layout = QHBoxLayout()
@@ -972,59 +1711,35 @@ class SettingsWindow(QMainWindow):
         whitelist_btn_layout.addWidget(delete_whitelist_btn)
         whitelist_btn_layout.addStretch()
         
-        layout.addWidget(self.whitelist_table)
+        layout.addWidget(self.whitelist_view)
         layout.addLayout(whitelist_btn_layout)
         
-        # 自动保存：响应表格变化即可，不再需要保存按钮
-        # 连接表格变化信号（注意在填充完成后再启用）
-        self.blacklist_table.blockSignals(True)
-        self.whitelist_table.blockSignals(True)
-        self.blacklist_table.itemChanged.connect(self.on_blacklist_table_changed)
-        self.whitelist_table.itemChanged.connect(self.on_whitelist_table_changed)
-        self.blacklist_table.blockSignals(False)
-        self.whitelist_table.blockSignals(False)
+        # 自动保存：响应列表的编辑、添加和删除，不再需要保存按钮
+        for model, slot in ((self.blacklist_model, self.on_blacklist_table_changed),
+                            (self.whitelist_model, self.on_whitelist_table_changed)):
+            model.dataChanged.connect(slot)
+            model.rowsInserted.connect(slot)
+            model.rowsRemoved.connect(slot)
         
         layout.addStretch()
         return widget
     
     def create_search_api_page(self):
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(30, 30, 30, 30)
-
-        title = QLabel("搜索引擎API设置")
-        title.setObjectName("page_title")
-        layout.addWidget(title)
+        widget, layout = self._make_page("搜索引擎API设置")
 
         info = QLabel("配置您喜欢的搜索引擎API密钥和URL（APIURL需包含{query}占位符 可选{apikey}占位符）")
         layout.addWidget(info)
 
         # API表格（名称、APIURL、APIKEY、结果路径、title、url、snippet、publish_date、APIKEY头名）
-        self.api_table = QTableWidget(len(self.api_manager.search_engines), 9)
-        self.api_table.setHorizontalHeaderLabels(["名称", "APIURL", "APIKEY", "结果列表路径", "title键", "url键", "snippet键", "publish_date键", "APIKEY头名"])
+        self.api_model = ApiEnginesModel(self.api_manager, self)
+        self.api_table = QTableView()
+        self.api_table.setModel(self.api_model)
         self.api_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.api_table.setEditTriggers(QAbstractItemView.AllEditTriggers)
-
-        # 填充数据
-        for row, (engine, config) in enumerate(self.api_manager.search_engines.items()):
-            name_item = QTableWidgetItem(engine)
-            apiurl_item = QTableWidgetItem(config.get("api_url", ""))
-            apikey_item = QTableWidgetItem(config.get("api_key", ""))
-            results_path_item = QTableWidgetItem(config.get('results_path', ''))
-            json_title_item = QTableWidgetItem(config.get('json_title', ''))
-            json_url_item = QTableWidgetItem(config.get('json_url', ''))
-            json_snippet_item = QTableWidgetItem(config.get('json_snippet', ''))
-            json_publish_item = QTableWidgetItem(config.get('json_publish_date', ''))
-            json_keyheader_item = QTableWidgetItem(config.get('json_keyheader', ''))
-            self.api_table.setItem(row, 0, name_item)
-            self.api_table.setItem(row, 1, apiurl_item)
-            self.api_table.setItem(row, 2, apikey_item)
-            self.api_table.setItem(row, 3, results_path_item)
-            self.api_table.setItem(row, 4, json_title_item)
-            self.api_table.setItem(row, 5, json_url_item)
-            self.api_table.setItem(row, 6, json_snippet_item)
-            self.api_table.setItem(row, 7, json_publish_item)
-            self.api_table.setItem(row, 8, json_keyheader_item)
+        # 第 3 列（结果列表路径）按主题单独着色
+        self.api_column_delegate = ThemedColumnDelegate(self.api_table)
+        self.api_column_delegate.dark = self.theme == "dark"
+        self.api_table.setItemDelegateForColumn(3, self.api_column_delegate)
 
         layout.addWidget(self.api_table)
 
@@ -1040,50 +1755,19 @@ class SettingsWindow(QMainWindow):
         layout.addLayout(api_btn_layout)
 
         # 自动保存：响应表格变化，不需要保存按钮
-        self.api_table.blockSignals(True)
-        self.api_table.itemChanged.connect(self.on_api_table_changed)
-        self.api_table.blockSignals(False)
+        self.api_model.changed.connect(self.on_api_table_changed)
 
         layout.addStretch()
         return widget
 
     def add_api_item(self):
-        row = self.api_table.rowCount()
-        self.api_table.insertRow(row)
-        name_item = QTableWidgetItem("")
-        apiurl_item = QTableWidgetItem("")
-        apikey_item = QTableWidgetItem("")
-        results_path_item = QTableWidgetItem("")
-        json_title_item = QTableWidgetItem("title")
-        json_url_item = QTableWidgetItem("url")
-        json_snippet_item = QTableWidgetItem("snippet")
-        json_publish_item = QTableWidgetItem("publish_date")
-        json_keyheader_item = QTableWidgetItem("")
-        self.api_table.setItem(row, 0, name_item)
-        self.api_table.setItem(row, 1, apiurl_item)
-        self.api_table.setItem(row, 2, apikey_item)
-        self.api_table.setItem(row, 3, results_path_item)
-        self.api_table.setItem(row, 4, json_title_item)
-        self.api_table.setItem(row, 5, json_url_item)
-        self.api_table.setItem(row, 6, json_snippet_item)
-        self.api_table.setItem(row, 7, json_publish_item)
-        self.api_table.setItem(row, 8, json_keyheader_item)
-        self.on_api_table_changed()
+        self.api_model.append_row()
 
     def delete_api_item(self):
-        current_row = self.api_table.currentRow()
-        if current_row >= 0:
-            self.api_table.removeRow(current_row)
-            self.on_api_table_changed()
+        self.api_model.remove_row(self.api_table.currentIndex().row())
     
     def create_about_page(self):
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(30, 30, 30, 30)
-        
-        title = QLabel("关于 EasySearch")
-        title.setObjectName("page_title")
-        layout.addWidget(title)
+        widget, layout = self._make_page("关于 EasySearch")
         
         about_text = QLabel("""
         <h3>EasySearch 简易搜索</h3>
@@ -1103,118 +1787,67 @@ class SettingsWindow(QMainWindow):
         return widget
     
     def add_blacklist_item(self):
-        row = self.blacklist_table.rowCount()
-        self.blacklist_table.insertRow(row)
-        self.blacklist_table.setItem(row, 0, QTableWidgetItem(""))
-        # 自动保存
-        self.on_blacklist_table_changed()
+        # 模型发出 rowsInserted 后自动保存
+        self.blacklist_model.insertRow(self.blacklist_model.rowCount())
         
     def delete_blacklist_item(self):
-        current_row = self.blacklist_table.currentRow()
+        current_row = self.blacklist_view.currentIndex().row()
         if current_row >= 0:
-            self.blacklist_table.removeRow(current_row)
-            # 自动保存
-            self.on_blacklist_table_changed()
+            self.blacklist_model.removeRow(current_row)
     
     def add_whitelist_item(self):
-        row = self.whitelist_table.rowCount()
-        self.whitelist_table.insertRow(row)
-        self.whitelist_table.setItem(row, 0, QTableWidgetItem(""))
-        # 自动保存
-        self.on_whitelist_table_changed()
+        self.whitelist_model.insertRow(self.whitelist_model.rowCount())
     
     def delete_whitelist_item(self):
-        current_row = self.whitelist_table.currentRow()
+        current_row = self.whitelist_view.currentIndex().row()
         if current_row >= 0:
-            self.whitelist_table.removeRow(current_row)
-            # 自动保存
-            self.on_whitelist_table_changed()
+            self.whitelist_model.removeRow(current_row)
+
+    @staticmethod
+    def _domains(model):
+        """从列表模型取出域名，去掉首尾空白并跳过空行。"""
+        return [d.strip() for d in model.stringList() if d.strip()]
 
     def on_blacklist_table_changed(self):
-        # 从表格重建黑名单并保存
-        new_list = []
-        for row in range(self.blacklist_table.rowCount()):
-            item = self.blacklist_table.item(row, 0)
-            if item and item.text().strip():
-                new_list.append(item.text().strip())
-        self.api_manager.blacklist = new_list
-        try:
-            self.api_manager.save_settings()
-        except Exception:
-            pass
+        # 黑名单赋值时会重新编译匹配正则，所以整体赋值；保存则延迟合并
+        self.api_manager.blacklist = self._domains(self.blacklist_model)
+        self.schedule_save()
 
     def on_whitelist_table_changed(self):
-        new_list = []
-        for row in range(self.whitelist_table.rowCount()):
-            item = self.whitelist_table.item(row, 0)
-            if item and item.text().strip():
-                new_list.append(item.text().strip())
-        self.api_manager.whitelist = new_list
-        try:
-            self.api_manager.save_settings()
-        except Exception:
-            pass
+        self.api_manager.whitelist = self._domains(self.whitelist_model)
+        self.schedule_save()
 
     def on_api_table_changed(self):
-        # 从 api_table 重建 search_engines 配置并保存
-        se = {}
-        for row in range(self.api_table.rowCount()):
-            engine_item = self.api_table.item(row, 0)
-            api_url_item = self.api_table.item(row, 1)
-            api_key_item = self.api_table.item(row, 2)
-            results_path_item = self.api_table.item(row, 3)
-            json_title_item = self.api_table.item(row, 4)
-            json_url_item = self.api_table.item(row, 5)
-            json_snippet_item = self.api_table.item(row, 6)
-            json_publish_item = self.api_table.item(row, 7)
-            json_keyheader_item = self.api_table.item(row, 8)
-            if not engine_item:
-                continue
-            engine = engine_item.text()
-            api_url = api_url_item.text() if api_url_item else ''
-            api_key = api_key_item.text() if api_key_item else ''
-            results_path = results_path_item.text() if results_path_item else ''
-            json_title = json_title_item.text() if json_title_item else 'title'
-            json_url = json_url_item.text() if json_url_item else 'url'
-            json_snippet = json_snippet_item.text() if json_snippet_item else 'snippet'
-            json_publish = json_publish_item.text() if json_publish_item else 'publish_date'
-            json_keyheader = json_keyheader_item.text() if json_keyheader_item else ''
-            se[engine] = {
-                'enabled': True,
-                'api_url': api_url,
-                'api_key': api_key,
-                'results_path': results_path,
-                'json_title': json_title,
-                'json_url': json_url,
-                'json_snippet': json_snippet,
-                'json_publish_date': json_publish,
-                'json_keyheader': json_keyheader
-            }
-
-        # 覆盖并保存
-        self.api_manager.search_engines = se
-        try:
-            self.api_manager.save_settings()
-        except Exception:
-            pass
+        # 模型已直接更新 search_engines，这里只负责保存
+        self.schedule_save()
+
+    def schedule_save(self):
+        """安排一次延迟保存，计时期间的再次修改会重新计时。"""
+        self._save_timer.start()
+
+    def flush_pending_save(self, sync=False):
+        """如果还有没落盘的修改，立即保存；sync 为 True 时在当前线程写完再返回（程序退出前使用）。"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            if sync:
+                try:
+                    self.api_manager.save_settings()
+                except Exception:
+                    pass
+            else:
+                self._save_settings()
 
-    def _cleanup_worker(self, worker):
-        """在线程结束时清理 worker 对象，确保不会提前销毁仍在运行的线程。"""
+    def _save_settings(self):
+        # 快照在 GUI 线程生成，序列化和写盘交给线程池
         try:
-            # 等待线程完全结束（已结束则立即返回）
-            worker.wait(1000)
+            self.api_manager.save_settings_async()
         except Exception:
             pass
-        try:
-            if worker in self._workers:
-                self._workers.remove(worker)
-        except Exception:
-            pass
-        try:
-            worker.deleteLater()
-        except Exception:
-            pass
-    
+
+    def closeEvent(self, event):
+        self.flush_pending_save()
+        super().closeEvent(event)
+
     def save_blackwhite_list(self):
         # 已改为自动保存，不再使用此方法
         pass
@@ -1231,41 +1864,22 @@ class SettingsWindow(QMainWindow):
             self.current_nav_key = new_nav_key
             self.update_nav_style()
             
-            page_index = {
-                "basic": 0, "blacklist": 1, "search_api": 2, "about": 3
-            }[new_nav_key]
-            self.content_stack.setCurrentIndex(page_index)
+            self.show_page(new_nav_key)
+
+    def show_page(self, nav_key):
+        """切换到指定页面，页面还没创建时先创建并加入 content_stack。"""
+        page = self._pages.get(nav_key)
+        if page is None:
+            page = self._pages[nav_key] = getattr(self, self._PAGE_BUILDERS[nav_key])()
+            self.content_stack.addWidget(page)
+        self.content_stack.setCurrentWidget(page)
     
     def update_nav_style(self):
+        # 选中状态通过动态属性切换，样式规则都在全局样式表里
         for key, btn in self.nav_buttons.items():
-            if key == self.current_nav_key:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        text-align: left;
-                        padding: 12px 20px;
-                        border: none;
-                        background-color: #1a73e8;
-                        color: white;
-                        font-size: 14px;
-                        border-radius: 0px;
-                    }
-                """)
-            else:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        text-align: left;
-                        padding: 12px 20px;
-                        border: none;
-                        background-color: transparent;
-                        color: #666;
-                        font-size: 14px;
-                        border-radius: 0px;
-                    }
-                    QPushButton:hover {
-                        background-color: #e8f0fe;
-                        color: #1a73e8;
-                    }
-                """)
+            btn.setProperty('selected', key == self.current_nav_key)
+            btn.style().unpolish(btn)
+            btn.style().polish(btn)
     
     def on_theme_changed(self, theme_text):
         if theme_text == "浅色模式":
@@ -1279,83 +1893,62 @@ class SettingsWindow(QMainWindow):
             self.parent().apply_theme(theme)
         self.apply_theme_to_settings(theme)
         # 主题更改后自动保存设置
-        try:
-            self.api_manager.save_settings()
-        except Exception:
-            pass
+        self.schedule_save()
     
     def apply_theme_to_settings(self, theme):
-        if theme == "light":
-            self.setStyleSheet("""
-                QMainWindow {
-                    background-color: white;
-                }
-                QWidget#sidebar {
-                    background-color: #f8f9fa;
-                    border-right: 1px solid #e0e0e0;
-                }
-                QLabel#settings_title {
-                    color: #333;
-                }
-                QLabel#page_title, QLabel#section_title {
-                    color: #333;
-                }
-                QStackedWidget#content_stack {
-                    background-color: white;
-                }
-                QTableWidget {
-                    background-color: white;
-                    color: black;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QMainWindow {
-                    background-color: #202124;
-                }
-                QWidget#sidebar {
-                    background-color: #303134;
-                    border-right: 1px solid #5f6368;
-                }
-                QLabel#settings_title {
-                    color: #e8eaed;
-                }
-                QLabel#page_title, QLabel#section_title {
-                    color: #e8eaed;
-                }
-                QStackedWidget#content_stack {
-                    background-color: #303134;
-                }
-                QTableWidget {
-                    background-color: #303134;
-                    color: #e8eaed;
-                }
-            """)
+        self.theme = theme
+        # 窗口样式来自全局样式表；有父窗口时由父窗口负责切换
+        if self.parent() is None:
+            apply_app_stylesheet(theme)
         # 刷新API表格启用列样式
-        if hasattr(self, 'api_table'):
-            for row in range(self.api_table.rowCount()):
-                enabled_item = self.api_table.item(row, 3)
-                if enabled_item:
-                    if theme == "dark":
-                        enabled_item.setBackground(Qt.black)
-                        enabled_item.setForeground(Qt.white)
-                    else:
-                        enabled_item.setBackground(Qt.white)
-                        enabled_item.setForeground(Qt.black)
+        if hasattr(self, 'api_column_delegate'):
+            self.api_column_delegate.dark = theme == "dark"
+            self.api_table.viewport().update()
+
+
+# 常见错误的关键字，一次扫描找出错误信息里出现的所有类别
+_ERROR_KIND_RE = re.compile(r'(?P<timeout>timed out|timeout)|(?P<connection>connection|无法连接)'
+                            r'|(?P<auth>401|403|unauthorized)', re.IGNORECASE)
+
+# 按优先级排列的错误类别和提示，同时出现多个类别时取靠前的
+_ERROR_MESSAGES = (
+    ('timeout', '请求超时：可能是网络或 API 不可用。'),
+    ('connection', '无法连接到服务器：请检查网络或 API 地址。'),
+    ('auth', '鉴权失败：请检查 API Key 或权限。'),
+)
+
+# 结果列表的排序键：先按权重，再按发布时间
+_RESULT_SORT_KEY = operator.attrgetter('weight', 'sort_ts')
+
 
 class EasySearchWindow(QMainWindow):
+    RENDER_DELAY_MS = 50
+    # 关闭窗口时最多等待后台线程退出多久（毫秒）
+    SHUTDOWN_WAIT_MS = 1000
+
     def __init__(self):
         super().__init__()
         self.api_manager = SearchAPIManager()
-        self.search_results = []
-        self.current_page = 0
-        self.results_per_page = 10
+        # 已去重、还没并入结果列表的新结果，由 _render_timer 统一刷新
+        self._pending_results = []
+        # 本次搜索已收录结果的规范化 URL，用于跨引擎去重
+        self._seen_urls = set()
         self._workers = []
+        # 当前这次搜索的 worker，旧搜索的 worker 发回的结果和错误都会被忽略
+        self.search_worker = None
+        self.settings_window = None
+        # 多个引擎连续返回结果时合并刷新，最多每 RENDER_DELAY_MS 毫秒更新一次结果列表
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(self.RENDER_DELAY_MS)
+        self._render_timer.timeout.connect(self._flush_pending_results)
+        # 窗口隐藏或最小化期间到达的结果先不刷新，等窗口再次显示时补上
+        self._results_dirty = False
         self.setup_ui()
         
     def setup_ui(self):
         self.setWindowTitle("EasySearch")
-        self.setWindowIcon(QIcon(get_source_path("icon.ico")))
+        self.setWindowIcon(QIcon(ICON_PATH))
         self.setMinimumSize(1000, 700)
         
         # 创建中央部件
@@ -1386,15 +1979,8 @@ class EasySearchWindow(QMainWindow):
         
         # Logo和标题
         self.logo_label = QLabel()
-        self.logo_label.setText(f"<img src='{get_source_path('icon.ico')}' width='24' height='24'> EasySearch")
-        self.logo_label.setStyleSheet("""
-            QLabel {
-                font-size: 36px;
-                font-weight: bold;
-                color: #4285f4;
-                margin-bottom: 10px;
-            }
-        """)
+        self.logo_label.setObjectName("logo_label")
+        self.logo_label.setText(LOGO_HTML)
         self.logo_label.setAlignment(Qt.AlignCenter)
         top_layout.addWidget(self.logo_label)
         
@@ -1403,37 +1989,14 @@ class EasySearchWindow(QMainWindow):
         search_layout.setAlignment(Qt.AlignCenter)
         
         self.search_input = QLineEdit()
+        self.search_input.setObjectName("search_input")
         self.search_input.setPlaceholderText("输入搜索内容...")
         self.search_input.setFixedSize(400, 40)
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                border: 2px solid #dfe1e5;
-                border-radius: 20px;
-                padding: 0px 15px;
-                font-size: 14px;
-                background-color: white;
-                color: black;
-            }
-            QLineEdit:focus {
-                border-color: #4285f4;
-            }
-        """)
         self.search_input.returnPressed.connect(self.perform_search)
         
         self.search_btn = QPushButton("🔍")
+        self.search_btn.setObjectName("search_btn")
         self.search_btn.setFixedSize(40, 40)
-        self.search_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4285f4;
-                border: none;
-                border-radius: 20px;
-                color: white;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background-color: #3367d6;
-            }
-        """)
         self.search_btn.clicked.connect(self.perform_search)
         
         search_layout.addWidget(self.search_input)
@@ -1445,93 +2008,45 @@ class EasySearchWindow(QMainWindow):
         
         # 设置按钮
         self.settings_btn = QPushButton("⚙️")
+        self.settings_btn.setObjectName("settings_btn")
         self.settings_btn.setFixedSize(40, 40)
-        self.settings_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: 2px solid #dfe1e5;
-                border-radius: 20px;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background-color: #f8f9fa;
-            }
-        """)
         self.settings_btn.clicked.connect(self.open_settings)
         
         # 将设置按钮添加到窗口
         self.settings_btn.setParent(self.central_widget)
         
     def setup_content_area(self):
-        # 搜索结果区域
-        self.results_scroll = QScrollArea()
-        self.results_scroll.setWidgetResizable(True)
-        self.results_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.results_scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-        """)
-        
-        self.results_container = QWidget()
-        self.results_layout = QVBoxLayout(self.results_container)
-        self.results_layout.setAlignment(Qt.AlignTop)
-        self.results_layout.setSpacing(10)
-        self.results_layout.setContentsMargins(0, 0, 0, 0)
-        
-        self.results_scroll.setWidget(self.results_container)
-        self.main_layout.addWidget(self.results_scroll)
+        # 搜索结果区域：列表视图 + 卡片委托，只绘制可见的结果
+        self.results_model = SearchResultsModel(self)
+        self.results_view = QListView()
+        self.results_view.setObjectName("results_view")
+        self.results_view.setModel(self.results_model)
+        self.result_delegate = ResultCardDelegate(self.results_view, self.api_manager.theme_mode)
+        self.results_view.setItemDelegate(self.result_delegate)
+        self.results_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.results_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.results_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.results_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.results_view.setFocusPolicy(Qt.NoFocus)
+        # 卡片等高，视图不必逐行测量高度；宽度变化时重新布局
+        self.results_view.setUniformItemSizes(True)
+        self.results_view.setResizeMode(QListView.Adjust)
+        self.results_view.setMouseTracking(True)
+        self.results_view.viewport().setCursor(Qt.PointingHandCursor)
+        # 点击卡片打开对应的 URL
+        self.results_view.clicked.connect(self.on_result_clicked)
+        self.main_layout.addWidget(self.results_view)
         
     def setup_bottom_area(self):
         self.bottom_container = QWidget()
         bottom_layout = QVBoxLayout(self.bottom_container)
         bottom_layout.setAlignment(Qt.AlignCenter)
         
-        # 加载指示器（水平居中，位于分页控件上方）
+        # 加载指示器（水平居中）；结果不分页，全部放在列表里滚动浏览
         self.loading_dots = LoadingDots()
-        self.loading_dots.setStyleSheet("font-size: 20px; color: #4285f4;")
+        self.loading_dots.setObjectName("loading_dots")
         bottom_layout.addWidget(self.loading_dots, 0, Qt.AlignHCenter)
         
-        # 分页控件
-        self.pagination_container = QWidget()
-        pagination_layout = QHBoxLayout(self.pagination_container)
-        pagination_layout.setAlignment(Qt.AlignCenter)
-        
-        self.prev_btn = QPushButton("上一页")
-        self.next_btn = QPushButton("下一页")
-        
-        for btn in [self.prev_btn, self.next_btn]:
-            btn.setFixedSize(80, 35)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #f8f9fa;
-                    border: 1px solid #dadce0;
-                    border-radius: 4px;
-                    padding: 8px 16px;
-                    color: #3c4043;
-                }
-                QPushButton:hover {
-                    background-color: #f1f3f4;
-                }
-                QPushButton:disabled {
-                    color: #9aa0a6;
-                }
-            """)
-        
-        self.prev_btn.clicked.connect(self.prev_page)
-        self.next_btn.clicked.connect(self.next_page)
-        
-        self.page_label = QLabel("第 1 页")
-        self.page_label.setStyleSheet("color: #5f6368; margin: 0px 15px;")
-        
-        pagination_layout.addWidget(self.prev_btn)
-        pagination_layout.addWidget(self.page_label)
-        pagination_layout.addWidget(self.next_btn)
-        
-        bottom_layout.addWidget(self.pagination_container)
-        self.pagination_container.hide()
-        
         self.main_layout.addWidget(self.bottom_container)
         
     def resizeEvent(self, event):
@@ -1543,10 +2058,18 @@ class EasySearchWindow(QMainWindow):
         if not query:
             return
             
+        self._render_timer.stop()
         self.clear_results()
+        # 新的搜索从空结果开始，去重集合也一并清空
+        self._pending_results = []
+        self._seen_urls = set()
         self.loading_dots.start_animation()
-        self.pagination_container.hide()
-        # 如果已有正在运行的 worker，尝试先停止（短等待）
+        # 通知之前仍在运行的 worker 停止（不等待），它们结束后由 finished 信号清理
+        for old_worker in self._workers:
+            try:
+                old_worker.stop()
+            except Exception:
+                pass
         # 在后台线程运行搜索，注意不要在运行时销毁仍在运行的线程。
         worker = SearchWorker(self.api_manager, query, parent=None)
         self._workers.append(worker)
@@ -1556,120 +2079,94 @@ class EasySearchWindow(QMainWindow):
         worker.error_occurred.connect(lambda msg, w=worker: self.on_worker_error(msg, w))
         # 线程结束时做清理，确保不会被销毁时仍在运行
         def _on_finished(w=worker):
+            if w is not self.search_worker:
+                # 已被新搜索取代的 worker，只做清理，不动当前搜索的界面
+                self._cleanup_worker(w)
+                return
+            self.search_worker = None
             try:
-                if w in self._workers:
-                    self._workers.remove(w)
-            except Exception:
-                pass
-            try:
-                # 搜索全部完成后停止动画并显示分页
+                # 搜索全部完成后停止动画
                 try:
                     self.loading_dots.stop_animation()
                 except Exception:
                     pass
+                # 剩下的结果立即并入列表，不必再等延迟刷新
                 try:
-                    self.pagination_container.show()
+                    self._render_timer.stop()
+                    self._flush_pending_results()
                 except Exception:
                     pass
-                # 如果有结果，显示第一页
-                try:
-                    if len(self.search_results) > 0:
-                        self.show_results_page(0)
-                except Exception:
-                    pass
-            except Exception:
-                pass
-            try:
-                w.deleteLater()
             except Exception:
                 pass
+            self._cleanup_worker(w)
         worker.finished.connect(_on_finished)
-        # 记住当前可取消引用的 worker（用于 UI 交互）
+        # 记住当前这次搜索的 worker
         self.search_worker = worker
         worker.start()
 
+    def _cleanup_worker(self, worker):
+        """线程结束后释放 worker，不在 GUI 线程上 wait()。
+
+        finished 信号在线程真正退出前发出，此时 isRunning() 可能仍为 True；
+        被取消的搜索中，引擎线程还可能卡在请求里并在之后访问 worker。
+        两种情况都稍后再试，直到 is_idle() 才销毁。
+        """
+        if not worker.is_idle():
+            QTimer.singleShot(10 if worker.isRunning() else 100, lambda: self._cleanup_worker(worker))
+            return
+        try:
+            if worker in self._workers:
+                self._workers.remove(worker)
+        except Exception:
+            pass
+        try:
+            worker.deleteLater()
+        except Exception:
+            pass
+
     def on_worker_results(self, results, worker):
         """当某个后台 worker 发回结果时调用（在主线程执行）。"""
         # 将新到达的结果追加并立即渲染（先到先渲染）
         # results 是一个列表
         if not isinstance(results, list):
             return
-        # 先把已有结果的规范化 URL 收集好用于去重判断
-        existing_urls = set()
-        for r in self.search_results:
-            nu = r.get('norm_url') if isinstance(r, dict) else ''
-            if not nu:
-                nu = canonicalize_url(r.get('url') if isinstance(r, dict) else None)
-            if nu:
-                existing_urls.add(nu)
-
+        # 已被新搜索取代的 worker 可能还有排队中的结果，直接丢弃
+        if worker is not None and worker is not self.search_worker:
+            return
         # 收集此次从单个引擎返回的非重复新结果
+        seen_urls = self._seen_urls
         new_results = []
         for r in results:
-            nu = r.get('norm_url') if isinstance(r, dict) else ''
+            nu = r.norm_url
             if not nu:
-                nu = canonicalize_url(r.get('url') if isinstance(r, dict) else None)
-                try:
-                    if isinstance(r, dict):
-                        r['norm_url'] = nu
-                except Exception:
-                    pass
+                nu = r.norm_url = canonicalize_url(r.url)
 
             # 如果有规范化 URL 并且已存在，则跳过
-            if nu and nu in existing_urls:
+            if nu and nu in seen_urls:
                 continue
 
             new_results.append(r)
             if nu:
-                existing_urls.add(nu)
+                seen_urls.add(nu)
 
-        # 合并所有新结果（一次性），然后排序并刷新页面/分页
+        # 新结果先放进待合并列表，稍后统一刷新，计时期间到达的结果一起显示
         if new_results:
-            self.search_results.extend(new_results)
-
-            def _sort_key(item):
-                w = item.get('weight', 0.0)
-                pub = item.get('publish_date')
-                ts = 0.0
-                if isinstance(pub, datetime):
-                    try:
-                        ts = pub.timestamp()
-                    except Exception:
-                        ts = 0.0
-                return (w, ts)
-
-            # 按权重和发布时间排序（降序）
-            self.search_results.sort(key=_sort_key, reverse=True)
-
-            # 刷新当前页面并显示分页控件
-            try:
-                self.show_results_page(self.current_page)
-            except Exception:
-                pass
-            try:
-                self.pagination_container.show()
-            except Exception:
-                pass
-        if getattr(self, 'search_worker', None) is worker:
-            self.search_worker = None
+            self._pending_results.extend(new_results)
+            if not self._render_timer.isActive():
+                self._render_timer.start()
 
     def on_worker_error(self, message: str, worker):
         """在主线程显示错误弹窗并把错误保存到日志。"""
+        if worker is not None and worker is not self.search_worker:
+            return
         try:
             log_path = self.api_manager.log_error(message)
         except Exception:
             log_path = ''
 
         # 简单分类常见错误
-        lower = message.lower()
-        if 'timed out' in lower or 'timeout' in lower:
-            user_msg = '请求超时：可能是网络或 API 不可用。'
-        elif 'connectionerror' in lower or 'connection' in lower or '无法连接' in message:
-            user_msg = '无法连接到服务器：请检查网络或 API 地址。'
-        elif '401' in lower or '403' in lower or 'unauthorized' in lower:
-            user_msg = '鉴权失败：请检查 API Key 或权限。'
-        else:
-            user_msg = f'发生错误：{message}'
+        kinds = {m.lastgroup for m in _ERROR_KIND_RE.finditer(message)}
+        user_msg = next((msg for kind, msg in _ERROR_MESSAGES if kind in kinds), f'发生错误：{message}')
 
         if log_path:
             user_msg += f"\n\n错误日志已保存至：{log_path}"
@@ -1680,121 +2177,72 @@ class EasySearchWindow(QMainWindow):
             pass
         
     def open_settings(self):
-        self.settings_window = SettingsWindow(self.api_manager, self)
+        # 设置窗口关闭时只是隐藏，再次打开直接复用，不重新创建
+        if self.settings_window is None:
+            self.settings_window = SettingsWindow(self.api_manager, self)
         self.settings_window.show()
+        self.settings_window.raise_()
+        self.settings_window.activateWindow()
         
     def clear_results(self):
-        for i in reversed(range(self.results_layout.count())):
-            widget = self.results_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
+        self.results_model.set_rows([])
                 
-    def show_results_page(self, page):
-        self.current_page = page
-        self.clear_results()
-        
-        start_idx = page * self.results_per_page
-        end_idx = start_idx + self.results_per_page
-        page_results = self.search_results[start_idx:end_idx]
-        
-        for result in page_results:
-            result_widget = SearchResultWidget(result, self.api_manager.theme_mode)
-            self.results_layout.addWidget(result_widget)
-            
-        total_pages = (len(self.search_results) + self.results_per_page - 1) // self.results_per_page
-        self.page_label.setText(f"第 {page + 1} 页 / 共 {total_pages} 页")
-        self.prev_btn.setEnabled(page > 0)
-        self.next_btn.setEnabled(page < total_pages - 1)
-
-    def add_results(self, results):
-        """Append and render result objects without clearing existing widgets."""
-        for result in results:
+    def _flush_pending_results(self):
+        """把待合并的新结果并入结果列表；窗口不可见时只做标记，到 showEvent 再刷新。"""
+        if not self.isVisible() or self.isMinimized():
+            self._results_dirty = bool(self._pending_results)
+            return
+        self._results_dirty = False
+        pending, self._pending_results = self._pending_results, []
+        # 排序用的权重和时间戳已由 worker 算好，这里只按属性取值
+        # 已有结果本身有序，只需排好新的一批再归并（降序，权重相同看发布时间）
+        pending.sort(key=_RESULT_SORT_KEY, reverse=True)
+        self.results_model.merge_rows(pending, _RESULT_SORT_KEY)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._results_dirty:
+            self._flush_pending_results()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        # 从最小化恢复时补上期间积压的刷新
+        if event.type() == QEvent.WindowStateChange and self._results_dirty:
+            self._flush_pending_results()
+
+    def on_result_clicked(self, index):
+        url = self.results_model.result_at(index.row()).url
+        if url:
             try:
-                result_widget = SearchResultWidget(result, self.api_manager.theme_mode)
-                self.results_layout.addWidget(result_widget)
-            except Exception as e:
-                # 渲染异常也弹窗并写日志
-                log_path = self.api_manager.log_error(f"渲染结果异常: {repr(e)}\n数据: {result}")
-                msg = f"渲染结果时发生错误：{e}\n\n错误日志已保存至：{log_path}"
-                try:
-                    QMessageBox.critical(self, '渲染错误', msg)
-                except Exception:
-                    pass
-        # 更新分页标签
-        total_pages = (len(self.search_results) + self.results_per_page - 1) // self.results_per_page
-        current_page = (len(self.search_results)-1) // self.results_per_page if len(self.search_results)>0 else 0
-        self.page_label.setText(f"第 {current_page + 1} 页 / 共 {total_pages} 页")
-        self.prev_btn.setEnabled(current_page > 0)
-        self.next_btn.setEnabled(current_page < total_pages - 1)
-        
-    def prev_page(self):
-        if self.current_page > 0:
-            self.show_results_page(self.current_page - 1)
-            
-    def next_page(self):
-        total_pages = (len(self.search_results) + self.results_per_page - 1) // self.results_per_page
-        if self.current_page < total_pages - 1:
-            self.show_results_page(self.current_page + 1)
+                QDesktopServices.openUrl(QUrl(url))
+            except Exception:
+                pass
+        
             
     def apply_theme(self, theme):
         self.api_manager.theme_mode = theme
-        if theme == "light":
-            self.setStyleSheet("""
-        total_results = len(self.search_results)
-        total_pages = (total_results + self.results_per_page - 1) // self.results_per_page
-        # 页码边界修正
-        if page < 0:
-            page = 0
-        if page >= total_pages:
-            page = total_pages - 1 if total_pages > 0 else 0
-        self.current_page = page
-        self.clear_results()
-        start_idx = page * self.results_per_page
-        end_idx = min(start_idx + self.results_per_page, total_results)
-        page_results = self.search_results[start_idx:end_idx]
-        for result in page_results:
-            result_widget = SearchResultWidget(result, self.api_manager.theme_mode)
-            self.results_layout.addWidget(result_widget)
-        self.page_label.setText(f"第 {page + 1} 页 / 共 {total_pages} 页")
-        self.prev_btn.setEnabled(page > 0)
-        self.next_btn.setEnabled(page < total_pages - 1)
-                QPushButton:hover {
-                    background-color: #f8f9fa;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QMainWindow, QWidget {
-                    background-color: #202124;
-                    color: #e8eaed;
-                }
-            """)
-            self.settings_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    border: 2px solid #5f6368;
-                    border-radius: 20px;
-                    font-size: 16px;
-                    color: #e8eaed;
-                }
-                QPushButton:hover {
-                    background-color: #303134;
-                }
-            """)
-        
-        for i in range(self.results_layout.count()):
-            widget = self.results_layout.itemAt(i).widget()
-            if isinstance(widget, SearchResultWidget):
-                widget.theme = theme
-                widget.update_theme()
+        apply_app_stylesheet(theme)
+        # 结果卡片由委托绘制，换主题只需重绘可见区域
+        self.result_delegate.theme = theme
+        self.results_view.viewport().update()
     
     def closeEvent(self, event):
-        # 关闭窗口时尝试停止所有后台线程
+        # 设置窗口可能还有延迟保存没执行，先写入磁盘
+        if self.settings_window is not None:
+            self.settings_window.flush_pending_save(sync=True)
+        # 关闭窗口时通知所有后台线程停止，再统一等待它们退出
         for worker in self._workers:
             try:
                 worker.stop()
             except Exception:
                 pass
+        # 所有线程共用一个截止时间，总等待不超过 SHUTDOWN_WAIT_MS，而不是每个线程各等一次
+        deadline = QDeadlineTimer(self.SHUTDOWN_WAIT_MS)
+        for worker in self._workers:
+            try:
+                worker.wait(deadline)
+            except Exception:
+                pass
         super().closeEvent(event)
 
 if __name__ == "__main__":